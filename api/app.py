@@ -79,8 +79,26 @@ def project_pulse():
         (project_id,),
     ).fetchone()
 
+    evidence_rows = []
+    if snapshot is not None:
+        evidence_rows = db.execute(
+            """SELECT se.section, se.event_id,
+                      e.source_type, e.actor_display, e.occurred_at,
+                      e.permalink, e.text
+               FROM snapshot_evidence se
+               JOIN events e ON e.event_id = se.event_id
+               WHERE se.snapshot_id = ?""",
+            (snapshot["snapshot_id"],),
+        ).fetchall()
+
+    return jsonify(_build_pulse(project, snapshot, evidence_rows))
+
+
+def _build_pulse(project, snapshot, evidence_rows):
+    """Pulse payload for one project from its latest snapshot row (or None)."""
+    project_id = project["project_id"]
     if snapshot is None:
-        return jsonify({
+        return {
             "project_id": project_id,
             "project_name": project["name"],
             "snapshot_at": None,
@@ -88,20 +106,10 @@ def project_pulse():
             "headline": None,
             "sections": {},
             "message": "No status snapshot available yet for this project.",
-        })
+        }
 
     status = json.loads(snapshot["status_json"])
 
-    evidence_rows = db.execute(
-        """SELECT se.section, se.event_id,
-                  e.source_type, e.actor_display, e.occurred_at,
-                  e.permalink, e.text
-           FROM snapshot_evidence se
-           JOIN events e ON e.event_id = se.event_id
-           WHERE se.snapshot_id = ?""",
-        (snapshot["snapshot_id"],),
-    ).fetchall()
-
     evidence_by_id = {}
     for er in evidence_rows:
         evidence_by_id[er["event_id"]] = {
@@ -134,7 +142,7 @@ def project_pulse():
         if key in status and status[key]:
             sections[key] = resolve_section(status[key])
 
-    return jsonify({
+    return {
         "project_id": project_id,
         "project_name": project["name"],
         "snapshot_at": snapshot["snapshot_at"],
@@ -144,6 +152,66 @@ def project_pulse():
         },
         "headline": status.get("headline"),
         "sections": sections,
+    }
+
+
+# ---------- GET /api/pulse/batch?project_ids=a,b,c ----------
+
+PULSE_BATCH_MAX = 100
+
+
+@app.route("/api/pulse/batch", methods=["GET"])
+def project_pulse_batch():
+    db = get_db()
+    project_ids = list(dict.fromkeys(
+        p.strip() for p in request.args.get("project_ids", "").split(",") if p.strip()
+    ))
+
+    if not project_ids:
+        return jsonify({"error": "Missing required query parameter: project_ids"}), 400
+    if len(project_ids) > PULSE_BATCH_MAX:
+        return jsonify({"error": f"At most {PULSE_BATCH_MAX} project_ids per request"}), 400
+
+    placeholders = ",".join("?" * len(project_ids))
+    projects = {
+        r["project_id"]: r
+        for r in db.execute(
+            f"SELECT project_id, name, description FROM projects WHERE project_id IN ({placeholders})",
+            project_ids,
+        )
+    }
+    snapshots = {}
+    for r in db.execute(
+        f"SELECT * FROM v_project_latest_snapshot WHERE project_id IN ({placeholders})",
+        project_ids,
+    ):
+        snapshots.setdefault(r["project_id"], r)
+
+    evidence_by_snapshot = {}
+    if snapshots:
+        snapshot_ids = [r["snapshot_id"] for r in snapshots.values()]
+        for er in db.execute(
+            f"""SELECT se.snapshot_id, se.section, se.event_id,
+                       e.source_type, e.actor_display, e.occurred_at,
+                       e.permalink, e.text
+                FROM snapshot_evidence se
+                JOIN events e ON e.event_id = se.event_id
+                WHERE se.snapshot_id IN ({",".join("?" * len(snapshot_ids))})""",
+            snapshot_ids,
+        ):
+            evidence_by_snapshot.setdefault(er["snapshot_id"], []).append(er)
+
+    pulses = []
+    for pid in project_ids:
+        if pid not in projects:
+            continue
+        snapshot = snapshots.get(pid)
+        evidence = evidence_by_snapshot.get(snapshot["snapshot_id"], []) if snapshot else []
+        pulses.append(_build_pulse(projects[pid], snapshot, evidence))
+
+    return jsonify({
+        "pulses": pulses,
+        "not_found": [pid for pid in project_ids if pid not in projects],
     })
 
 
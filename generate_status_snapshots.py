@@ -26,7 +26,12 @@ import os
 import re
 import sqlite3
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from ai_utils import ai_extract_status_from_slack, ai_extract_status_from_jira
@@ -48,19 +53,77 @@ DONE_STATUSES = {"done", "closed", "resolved", "to verify"}
 # Status values that indicate in-flight work (next_steps)
 ACTIVE_STATUSES = {"in progress", "in review", "to do"}
 
-# Keywords for classification (lowercase)
-BLOCKER_KEYWORDS = ["blocked", "waiting", "stuck", "blocker", "blocking"]
-DECISION_KEYWORDS = ["decision", "decided", "agreed", "we will", "we'll", "adopt"]
-RISK_KEYWORDS = ["risk", "delay", "dependency", "may delay", "could delay"]
-NEXT_STEP_KEYWORDS = ["pr", "raised", "open", "review", "merge", "deploy"]
+# Keywords for classification (lowercase). Matched as whole words, so common inflections are listed too.
+BLOCKER_KEYWORDS = ["blocked", "waiting", "stuck", "blocker", "blockers", "blocking"]
+DECISION_KEYWORDS = [
+    "decision", "decisions", "decided", "agreed", "we will", "we'll",
+    "adopt", "adopted", "adopting", "adoption",
+]
+RISK_KEYWORDS = [
+    "risk", "risks", "risky", "delay", "delays", "delayed", "delaying",
+    "dependency", "dependencies", "may delay", "could delay",
+]
+NEXT_STEP_KEYWORDS = [
+    "pr", "prs", "raised", "open", "opened",
+    "review", "reviews", "reviewed", "reviewing",
+    "merge", "merged", "merging",
+    "deploy", "deploys", "deployed", "deploying", "deployment", "deployments",
+]
 # Additional keywords for Slack standups (action verbs, common status phrases)
-SLACK_NEXT_STEP_KEYWORDS = ["implement", "create", "update", "connect", "coordinate", "meeting", "ticket", "sprint", "work with"]
+SLACK_NEXT_STEP_KEYWORDS = [
+    "implement", "implements", "implemented", "implementing", "implementation",
+    "create", "creates", "created", "creating",
+    "update", "updates", "updated", "updating",
+    "connect", "connected", "connecting",
+    "coordinate", "coordinated", "coordinating",
+    "meeting", "meetings", "ticket", "tickets", "sprint", "sprints", "work with",
+]
+ALL_NEXT_STEP_KEYWORDS = NEXT_STEP_KEYWORDS + SLACK_NEXT_STEP_KEYWORDS
+
+# Keywords are matched as whole words: text is tokenized once and checked with set ops
+_WORD_RE = re.compile(r"[a-z']+")
+
+
+def _compile_keywords(keywords: List[str]) -> Tuple[FrozenSet[str], Tuple[Tuple[str, str], ...]]:
+    """Split keywords into a set of single words and (first_word, phrase) pairs for phrases."""
+    words = frozenset(kw for kw in keywords if " " not in kw)
+    phrases = tuple((kw.split(" ", 1)[0], kw) for kw in keywords if " " in kw)
+    return words, phrases
+
+
+def _has_keyword(
+    tokens: Set[str],
+    text_lower: str,
+    compiled: Tuple[FrozenSet[str], Tuple[Tuple[str, str], ...]],
+) -> bool:
+    words, phrases = compiled
+    if not words.isdisjoint(tokens):
+        return True
+    # Phrases only need a substring scan when their first word is present
+    return any(first in tokens and phrase in text_lower for first, phrase in phrases)
+
+
+_BLOCKER_KW = _compile_keywords(BLOCKER_KEYWORDS)
+_DECISION_KW = _compile_keywords(DECISION_KEYWORDS)
+_RISK_KW = _compile_keywords(RISK_KEYWORDS)
+_NEXT_STEP_KW = _compile_keywords(NEXT_STEP_KEYWORDS)
+_ALL_NEXT_STEP_KW = _compile_keywords(ALL_NEXT_STEP_KEYWORDS)
+
+# Max items kept per status_json section (events arrive newest-first, so the first N win)
+SECTION_LIMITS = {"progress": 10, "blockers": 5, "decisions": 5, "next_steps": 10, "risks": 5}
 
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def dumps_json(obj: Any) -> str:
+    """Serialize to a UTF-8 JSON string, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
 def extract_issue_key(text: str, event_id: str) -> Optional[str]:
     """Extract Jira issue key (e.g. CLOPS-1571) from text or event_id."""
     match = re.search(r"([A-Z][A-Z0-9]+-\d+)", text or "")
@@ -84,22 +147,19 @@ def classify_event(
     section: progress | blockers | decisions | next_steps | risks
     """
     text_lower = (text or "").lower()
-    actor = actor_display or "Unknown"
 
     if event_kind == "status_change":
         # Parse "CLOPS-1571 status changed: In Progress → Closed"
         to_status = None
-        from_status = None
-        issue_key = extract_issue_key(text, "")
+        # Only used to name the issue when text is empty, so the text regex could never match
+        issue_key = None
 
         if raw_json:
             try:
                 obj = json.loads(raw_json)
                 item = obj.get("item") or {}
                 to_status = (item.get("toString") or "").lower()
-                from_status = (item.get("fromString") or "").lower()
-                if not issue_key:
-                    issue_key = obj.get("issueKey")
+                issue_key = obj.get("issueKey")
             except json.JSONDecodeError:
                 pass
 
@@ -122,25 +182,26 @@ def classify_event(
             return ("next_steps", summary)
 
     if event_kind == "comment":
-        if any(kw in text_lower for kw in BLOCKER_KEYWORDS):
+        tokens = set(_WORD_RE.findall(text_lower))
+        if _has_keyword(tokens, text_lower, _BLOCKER_KW):
             return ("blockers", text)
-        if any(kw in text_lower for kw in DECISION_KEYWORDS):
+        if _has_keyword(tokens, text_lower, _DECISION_KW):
             return ("decisions", text)
-        if any(kw in text_lower for kw in RISK_KEYWORDS):
+        if _has_keyword(tokens, text_lower, _RISK_KW):
             return ("risks", text)
-        if any(kw in text_lower for kw in NEXT_STEP_KEYWORDS):
+        if _has_keyword(tokens, text_lower, _NEXT_STEP_KW):
             return ("next_steps", text)
 
     # Slack messages: heuristic fallback (AI extraction handled separately in build_snapshot)
     if event_kind == "message":
-        if any(kw in text_lower for kw in BLOCKER_KEYWORDS):
+        tokens = set(_WORD_RE.findall(text_lower))
+        if _has_keyword(tokens, text_lower, _BLOCKER_KW):
             return ("blockers", text[:500])
-        if any(kw in text_lower for kw in DECISION_KEYWORDS):
+        if _has_keyword(tokens, text_lower, _DECISION_KW):
             return ("decisions", text[:500])
-        if any(kw in text_lower for kw in RISK_KEYWORDS):
+        if _has_keyword(tokens, text_lower, _RISK_KW):
             return ("risks", text[:500])
-        all_next_keywords = NEXT_STEP_KEYWORDS + SLACK_NEXT_STEP_KEYWORDS
-        if any(kw in text_lower for kw in all_next_keywords):
+        if _has_keyword(tokens, text_lower, _ALL_NEXT_STEP_KW):
             return ("next_steps", text[:500])
         # Fallback: substantial Slack messages (standups, updates) linked to project get a summary
         if len(text_lower) > 150:
@@ -173,16 +234,26 @@ def build_snapshot_for_project(
     if not rows:
         return None
 
-    progress: List[Dict[str, Any]] = []
-    blockers: List[Dict[str, Any]] = []
-    decisions: List[Dict[str, Any]] = []
-    next_steps: List[Dict[str, Any]] = []
-    risks: List[Dict[str, Any]] = []
-    seen_progress: set = set()
-    seen_blockers: set = set()
-    seen_decisions: set = set()
-    seen_next_steps: set = set()
-    seen_risks: set = set()
+    buckets: Dict[str, List[Dict[str, Any]]] = {section: [] for section in SECTION_LIMITS}
+    # Distinct items per section, uncapped: the headline counts these, not the stored lists
+    seen: Dict[str, Set[str]] = {section: set() for section in SECTION_LIMITS}
+
+    def add(section: str, summary: str, owner: Optional[str], event_id: str) -> None:
+        """Count a deduped item in its section; store it only while the section has room."""
+        items = buckets.get(section)
+        if items is None:
+            return
+        # Dedupe by normalized summary (first 80 chars) + owner, packed into one string key
+        key = f"{summary[:80]}\x00{owner or ''}"
+        if key in seen[section]:
+            return
+        seen[section].add(key)
+        if len(items) >= SECTION_LIMITS[section]:
+            return
+        if section == "risks":
+            items.append({"text": summary[:500], "event_ids": [event_id]})
+        else:
+            items.append({"text": summary[:500], "owner": owner, "event_ids": [event_id]})
 
     for r in rows:
         event_id = r["event_id"]
@@ -215,22 +286,7 @@ def build_snapshot_for_project(
                 if item_project_ids and project_id not in item_project_ids:
                     continue
                 added_any = True
-                key = (summary[:80], owner or "")
-                if section == "progress" and key not in seen_progress:
-                    seen_progress.add(key)
-                    progress.append({"text": summary[:500], "owner": owner, "event_ids": [event_id]})
-                elif section == "blockers" and key not in seen_blockers:
-                    seen_blockers.add(key)
-                    blockers.append({"text": summary[:500], "owner": owner, "event_ids": [event_id]})
-                elif section == "decisions" and key not in seen_decisions:
-                    seen_decisions.add(key)
-                    decisions.append({"text": summary[:500], "owner": owner, "event_ids": [event_id]})
-                elif section == "next_steps" and key not in seen_next_steps:
-                    seen_next_steps.add(key)
-                    next_steps.append({"text": summary[:500], "owner": owner, "event_ids": [event_id]})
-                elif section == "risks" and key not in seen_risks:
-                    seen_risks.add(key)
-                    risks.append({"text": summary[:500], "event_ids": [event_id]})
+                add(section, summary, owner, event_id)
             if added_any:
                 continue  # AI handled this message
             # AI returned items but none for this project: fall through to heuristic
@@ -241,64 +297,35 @@ def build_snapshot_for_project(
             ai_result = ai_extract_status_from_jira(text, event_kind, actor, issue_key)
             if ai_result:
                 section, summary = ai_result
-                key = (summary[:80], actor or "")
-                if section == "progress" and key not in seen_progress:
-                    seen_progress.add(key)
-                    progress.append({"text": summary[:500], "owner": actor, "event_ids": [event_id]})
-                elif section == "blockers" and key not in seen_blockers:
-                    seen_blockers.add(key)
-                    blockers.append({"text": summary[:500], "owner": actor, "event_ids": [event_id]})
-                elif section == "decisions" and key not in seen_decisions:
-                    seen_decisions.add(key)
-                    decisions.append({"text": summary[:500], "owner": actor, "event_ids": [event_id]})
-                elif section == "next_steps" and key not in seen_next_steps:
-                    seen_next_steps.add(key)
-                    next_steps.append({"text": summary[:500], "owner": actor, "event_ids": [event_id]})
-                elif section == "risks" and key not in seen_risks:
-                    seen_risks.add(key)
-                    risks.append({"text": summary[:500], "event_ids": [event_id]})
+                add(section, summary, actor, event_id)
                 continue
 
         section, summary = classify_event(event_kind, text, raw_json, actor)
         if not section or not summary:
             continue
+        add(section, summary, actor, event_id)
 
-        # Dedupe by normalized summary (first 80 chars)
-        key = (summary[:80], actor or "")
-
-        if section == "progress" and key not in seen_progress:
-            seen_progress.add(key)
-            progress.append({"text": summary[:500], "owner": actor, "event_ids": [event_id]})
-        elif section == "blockers" and key not in seen_blockers:
-            seen_blockers.add(key)
-            blockers.append({"text": summary[:500], "owner": actor, "event_ids": [event_id]})
-        elif section == "decisions" and key not in seen_decisions:
-            seen_decisions.add(key)
-            decisions.append({"text": summary[:500], "owner": actor, "event_ids": [event_id]})
-        elif section == "next_steps" and key not in seen_next_steps:
-            seen_next_steps.add(key)
-            next_steps.append({"text": summary[:500], "owner": actor, "event_ids": [event_id]})
-        elif section == "risks" and key not in seen_risks:
-            seen_risks.add(key)
-            risks.append({"text": summary[:500], "event_ids": [event_id]})
-
-    # Build headline
+    progress = buckets["progress"]
+    blockers = buckets["blockers"]
+    next_steps = buckets["next_steps"]
+
+    # Build headline from the uncapped distinct counts
     parts = []
     if progress:
-        parts.append(f"{len(progress)} completed")
+        parts.append(f"{len(seen['progress'])} completed")
     if blockers:
-        parts.append(f"{len(blockers)} blocker(s)")
+        parts.append(f"{len(seen['blockers'])} blocker(s)")
     if next_steps:
-        parts.append(f"{len(next_steps)} in progress")
+        parts.append(f"{len(seen['next_steps'])} in progress")
     headline = f"{project_name}: " + "; ".join(parts) if parts else f"{project_name}: Activity in window"
 
     return {
         "headline": headline,
-        "progress": progress[:10],
-        "blockers": blockers[:5],
-        "decisions": decisions[:5],
-        "next_steps": next_steps[:10],
-        "risks": risks[:5],
+        "progress": progress,
+        "blockers": blockers,
+        "decisions": buckets["decisions"],
+        "next_steps": next_steps,
+        "risks": buckets["risks"],
     }
 
 
@@ -323,6 +350,19 @@ def main() -> None:
         for r in projects
     ]
 
+    # Projects with at least one event in the window; the rest have nothing to snapshot
+    active_project_ids = {
+        r["project_id"]
+        for r in conn.execute(
+            """
+            SELECT DISTINCT project_id
+            FROM v_project_events
+            WHERE occurred_at >= ? AND occurred_at <= ?
+            """,
+            (window_start.isoformat(), window_end.isoformat()),
+        ).fetchall()
+    }
+
     if AI_ENABLED:
         print("AI status extraction: enabled (Slack + Jira)")
 
@@ -330,6 +370,8 @@ def main() -> None:
     for p in projects:
         project_id = p["project_id"]
         project_name = p["name"]
+        if project_id not in active_project_ids:
+            continue
 
         status = build_snapshot_for_project(
             conn, project_id, project_name, window_start, window_end,
@@ -353,7 +395,7 @@ def main() -> None:
                 created_iso,
                 window_start.isoformat(),
                 window_end.isoformat(),
-                json.dumps(status, ensure_ascii=False),
+                dumps_json(status),
                 created_iso,
             ),
         )
@@ -28,6 +28,9 @@ Optional:
                   Comments/status changes are still deduped, so this is safe and reduces API calls.
   FULL_REFRESH=1  If set, ignores last_ingested_at and fetches all issues in the epic (use when child issues are missing).
   DEBUG=1         Print JQL queries and hit counts to diagnose why child issues (e.g. CLOPS-1570) are not found.
+  JIRA_MAX_WORKERS  default 8; max Jira requests in flight at once, across issue, comment-page
+                    and epic-discovery workers.
+  JIRA_BATCH        default 500; JQL page size requested (Jira may return fewer per page).
 
 Notes:
 - Jira Cloud v3 comment bodies are ADF JSON. We convert to plain text for events.text
@@ -37,13 +40,24 @@ Notes:
 from __future__ import annotations
 
 import os
+import re
 import json
 import base64
 import sqlite3
 import datetime
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 DB_PATH = os.environ.get("DB_PATH", "./projectpulse_demo.db")
@@ -53,68 +67,118 @@ JIRA_API_TOKEN = os.environ["JIRA_API_TOKEN"]
 INCREMENTAL = os.environ.get("INCREMENTAL", "0") == "1"
 FULL_REFRESH = os.environ.get("FULL_REFRESH", "0") == "1"
 DEBUG = os.environ.get("DEBUG", "0") == "1"
+JIRA_MAX_WORKERS = int(os.environ.get("JIRA_MAX_WORKERS", "8"))
+JIRA_BATCH = int(os.environ.get("JIRA_BATCH", "500"))
+COMMENT_PAGE_WORKERS = 4  # concurrent page fetches per issue once the comment total is known
+WRITE_BATCH_SIZE = 1000  # buffered event rows per flush
+COMMIT_EVERY_ISSUES = 200  # commit partial epic progress so a crash keeps finished issues
+SQLITE_MAX_VARIABLES = 999  # SQLITE_MAX_VARIABLE_NUMBER on older builds
+
+# Runs of whitespace collapsed to one space in extracted comment text
+_WS_RE = re.compile(r"\s+")
 
 
 def now_iso() -> str:
     return datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def dumps_json(obj: Any) -> str:
+    """Serialize to a UTF-8 JSON string, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints beyond 64 bits
+            pass
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# ADF walker: each handler emits text into `parts` and/or pushes children onto `stack`.
+# Children are pushed in reverse so they pop in document order; plain strings on the
+# stack are deferred output (e.g. the newline that closes a paragraph).
+def _adf_children(node: Dict[str, Any], parts: List[str], stack: List[Any]) -> None:
+    content = node.get("content") or []
+    stack.extend(child for child in reversed(content) if isinstance(child, dict))
+
+
+def _adf_block(node: Dict[str, Any], parts: List[str], stack: List[Any]) -> None:
+    content = node.get("content") or []
+    if content:
+        stack.append("\n")
+    stack.extend(child for child in reversed(content) if isinstance(child, dict))
+
+
+def _adf_table(node: Dict[str, Any], parts: List[str], stack: List[Any]) -> None:
+    for row in reversed(node.get("content") or []):
+        if isinstance(row, dict):
+            _adf_children(row, parts, stack)
+
+
+def _adf_code_block(node: Dict[str, Any], parts: List[str], stack: List[Any]) -> None:
+    for child in node.get("content") or []:
+        if isinstance(child, dict) and child.get("type") == "text":
+            parts.append(child.get("text") or "")
+    parts.append("\n")
+
+
+def _adf_text(node: Dict[str, Any], parts: List[str], stack: List[Any]) -> None:
+    parts.append(node.get("text") or "")
+
+
+def _adf_hard_break(node: Dict[str, Any], parts: List[str], stack: List[Any]) -> None:
+    parts.append("\n")
+
+
+def _adf_mention(node: Dict[str, Any], parts: List[str], stack: List[Any]) -> None:
+    attrs = node.get("attrs") or {}
+    parts.append(attrs.get("text") or attrs.get("id") or "")
+
+
+def _adf_emoji(node: Dict[str, Any], parts: List[str], stack: List[Any]) -> None:
+    attrs = node.get("attrs") or {}
+    parts.append(attrs.get("shortName") or "")
+
+
+_ADF_HANDLERS = {
+    "text": _adf_text,
+    "hardBreak": _adf_hard_break,
+    "mention": _adf_mention,
+    "emoji": _adf_emoji,
+    "table": _adf_table,
+    "codeBlock": _adf_code_block,
+    **dict.fromkeys(("paragraph", "heading", "listItem", "tableCell", "tableHeader"), _adf_block),
+}
+
+
 def adf_to_plain_text(adf: Any, max_len: int = 2000) -> str:
     """
     Extract plain text from Atlassian Document Format (ADF) JSON.
-    Recursively traverses doc/paragraph/text nodes. Returns empty string if invalid.
+    Walks doc/paragraph/text nodes with an explicit stack. Returns empty string if invalid.
     """
     if not adf or not isinstance(adf, dict):
         return ""
 
-    parts: List[str] = []
+    # Fast path: the common one-paragraph, one-text-run comment needs no walk
+    content = adf.get("content")
+    if adf.get("type") == "doc" and isinstance(content, list) and len(content) == 1:
+        para = content[0]
+        runs = para.get("content") if isinstance(para, dict) and para.get("type") == "paragraph" else None
+        if isinstance(runs, list) and len(runs) == 1 and isinstance(runs[0], dict) and runs[0].get("type") == "text":
+            return _WS_RE.sub(" ", runs[0].get("text") or "").strip()[:max_len]
 
-    def _walk(node: Any, in_block: bool = False) -> None:
-        if not isinstance(node, dict):
-            return
+    parts: List[str] = []
+    stack: List[Any] = [adf]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            parts.append(node)
+            continue
         node_type = node.get("type") or ""
-        content = node.get("content") or []
-
-        if node_type == "text":
+        if node_type == "text":  # most nodes; skip the handler dispatch
             parts.append(node.get("text") or "")
-        elif node_type == "hardBreak":
-            parts.append("\n")
-        elif node_type == "mention":
-            attrs = node.get("attrs") or {}
-            parts.append(attrs.get("text") or attrs.get("id") or "")
-        elif node_type == "emoji":
-            attrs = node.get("attrs") or {}
-            parts.append(attrs.get("shortName") or "")
-        elif node_type in ("paragraph", "heading", "listItem", "tableCell", "tableHeader"):
-            for child in content:
-                _walk(child, in_block=True)
-            if content:
-                parts.append("\n")
-        elif node_type in ("bulletList", "orderedList"):
-            for child in content:
-                _walk(child, in_block=True)
-        elif node_type in ("doc", "blockquote", "panel", "expand", "nestedExpand"):
-            for child in content:
-                _walk(child, in_block=in_block)
-        elif node_type == "table":
-            for row in content:
-                for cell in (row.get("content") or []):
-                    _walk(cell, in_block=True)
-        elif node_type == "tableRow":
-            for child in content:
-                _walk(child, in_block=True)
-        elif node_type == "codeBlock":
-            for child in content:
-                if isinstance(child, dict) and child.get("type") == "text":
-                    parts.append(child.get("text") or "")
-            parts.append("\n")
-        else:
-            for child in content:
-                _walk(child, in_block=in_block)
-
-    _walk(adf)
-    result = "".join(parts).strip()
-    result = " ".join(result.split())  # normalize whitespace
+            continue
+        _ADF_HANDLERS.get(node_type, _adf_children)(node, parts, stack)
+
+    result = _WS_RE.sub(" ", "".join(parts)).strip()  # normalize whitespace
     return result[:max_len] if result else ""
 
 
@@ -127,67 +191,189 @@ def jira_headers() -> Dict[str, str]:
     }
 
 
+def make_jira_session() -> requests.Session:
+    """Shared keep-alive session: auth headers built once, pooled connections sized for
+    JIRA_MAX_WORKERS (IN_FLIGHT caps concurrent requests at that), and transparent
+    retries on 429/5xx (honoring Retry-After)."""
+    session = requests.Session()
+    session.headers.update(jira_headers())
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),  # POST is only used for read-only JQL search
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=JIRA_MAX_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class RateLimiter:
+    """Spaces requests out to Jira's advertised refill rate so workers stay under the
+    limit instead of bursting into 429s. Pacing is learned from the
+    X-RateLimit-Interval-Seconds / X-RateLimit-FillRate response headers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._min_interval = 0.0
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self._min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def update(self, headers: Any) -> None:
+        try:
+            interval = float(headers.get("X-RateLimit-Interval-Seconds"))
+            fill_rate = float(headers.get("X-RateLimit-FillRate"))
+        except (TypeError, ValueError):
+            return
+        if interval > 0 and fill_rate > 0:
+            self._min_interval = interval / fill_rate
+
+
+SESSION = make_jira_session()
+RATE_LIMITER = RateLimiter()
+# Nested pools (issues x comment pages, plus epic discovery) could otherwise reach
+# JIRA_MAX_WORKERS * COMMENT_PAGE_WORKERS requests; this keeps the total at JIRA_MAX_WORKERS.
+# Only held around the HTTP call, so threads waiting on nested pools never hold a slot.
+IN_FLIGHT = threading.BoundedSemaphore(JIRA_MAX_WORKERS)
+
+
 def jira_get(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     url = f"{JIRA_BASE_URL}{path}"
-    r = requests.get(url, headers=jira_headers(), params=params, timeout=45)
+    RATE_LIMITER.wait()
+    with IN_FLIGHT:
+        r = SESSION.get(url, params=params, timeout=45)
+    RATE_LIMITER.update(r.headers)
+    r.raise_for_status()
+    return r.json()
+
+
+def jira_post(path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    url = f"{JIRA_BASE_URL}{path}"
+    RATE_LIMITER.wait()
+    with IN_FLIGHT:
+        r = SESSION.post(url, json=body, timeout=45)
+    RATE_LIMITER.update(r.headers)
     r.raise_for_status()
     return r.json()
 
 
-def jql_search(jql: str, fields: List[str], max_total: int = 1000) -> List[Dict[str, Any]]:
+_short_page_warned = False  # jql_search reports a server-side page cap only once per run
+
+
+def jql_search(
+    jql: str,
+    fields: List[str],
+    max_total: int = 1000,
+    batch_size: int = JIRA_BATCH,
+) -> List[Dict[str, Any]]:
     """
-    Search issues via JQL. Uses /rest/api/3/search/jql (legacy /search was removed).
-    Pagination uses nextPageToken instead of startAt.
+    Search issues via JQL. Uses POST /rest/api/3/search/jql (legacy /search was removed)
+    so long JQL/field lists aren't URL-capped. Pagination uses nextPageToken/isLast instead of
+    startAt; pages may hold fewer than batch_size issues.
     """
+    global _short_page_warned
     issues: List[Dict[str, Any]] = []
     next_page_token: Optional[str] = None
 
     while True:
-        params: Dict[str, Any] = {
+        body: Dict[str, Any] = {
             "jql": jql,
-            "fields": ",".join(fields),
-            "maxResults": min(50, max_total - len(issues)),
+            "fields": fields,
+            "maxResults": min(batch_size, max_total - len(issues)),
         }
         if next_page_token:
-            params["nextPageToken"] = next_page_token
+            body["nextPageToken"] = next_page_token
 
-        data = jira_get("/rest/api/3/search/jql", params=params)
+        data = jira_post("/rest/api/3/search/jql", body)
         batch = data.get("issues", [])
         issues.extend(batch)
         next_page_token = data.get("nextPageToken")
 
-        if len(batch) == 0 or not next_page_token or len(issues) >= max_total:
+        if (
+            not _short_page_warned
+            and 0 < len(batch) < body["maxResults"]
+            and next_page_token
+            and not data.get("isLast")
+        ):
+            _short_page_warned = True
+            print(
+                f"Warning: Jira returned {len(batch)} issues for maxResults={body['maxResults']}; "
+                f"the server caps page size below JIRA_BATCH={batch_size}, so searches take more requests."
+            )
+
+        if len(batch) == 0 or data.get("isLast") or not next_page_token or len(issues) >= max_total:
             break
 
     return issues[:max_total]
 
 
-def fetch_issue_with_changelog(issue_key: str) -> Dict[str, Any]:
-    return jira_get(
-        f"/rest/api/3/issue/{issue_key}",
-        params={
-            "fields": "summary,issuetype,project,subtasks,updated",
-            "expand": "changelog",
-        },
-    )
+def fetch_issue_meta(issue_key: str, fields: str = "summary,issuetype,project,updated,comment,subtasks") -> Dict[str, Any]:
+    """Fetch only the requested issue fields (no changelog expansion)."""
+    return jira_get(f"/rest/api/3/issue/{issue_key}", params={"fields": fields})
 
 
-def fetch_all_comments(issue_key: str, max_total: int = 1000) -> List[Dict[str, Any]]:
-    comments: List[Dict[str, Any]] = []
+def fetch_changelog(issue_key: str, max_total: int = 1000) -> List[Dict[str, Any]]:
+    """Page through /issue/{key}/changelog; returns history entries (id, author, created, items)."""
+    histories: List[Dict[str, Any]] = []
     start_at = 0
     while True:
         data = jira_get(
-            f"/rest/api/3/issue/{issue_key}/comment",
-            params={"startAt": start_at, "maxResults": 50},
+            f"/rest/api/3/issue/{issue_key}/changelog",
+            params={"startAt": start_at, "maxResults": 100},
         )
-        batch = data.get("comments", [])
-        comments.extend(batch)
+        batch = data.get("values", [])
+        histories.extend(batch)
         start_at += len(batch)
-        if len(batch) == 0 or start_at >= data.get("total", 0) or len(comments) >= max_total:
+        if len(batch) == 0 or data.get("isLast", True) or len(histories) >= max_total:
             break
+    return histories[:max_total]
+
+
+def fetch_all_comments(issue_key: str, max_total: int = 1000) -> List[Dict[str, Any]]:
+    """Fetch an issue's comments. The first page reports the total; any remaining
+    pages are then requested concurrently at precomputed startAt offsets."""
+
+    def fetch_page(start_at: int) -> Dict[str, Any]:
+        return jira_get(
+            f"/rest/api/3/issue/{issue_key}/comment",
+            params={"startAt": start_at, "maxResults": 100},
+        )
+
+    first = fetch_page(0)
+    comments: List[Dict[str, Any]] = list(first.get("comments", []))
+    total = min(first.get("total", 0), max_total)
+    page_size = len(comments)  # server may cap below the requested maxResults
+
+    if page_size and page_size < total:
+        starts = range(page_size, total, page_size)
+        with ThreadPoolExecutor(max_workers=min(COMMENT_PAGE_WORKERS, len(starts))) as pool:
+            for data in pool.map(fetch_page, starts):
+                comments.extend(data.get("comments", []))
     return comments[:max_total]
 
 
+def inline_comments(issue: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Comments embedded in the issue's "comment" field, or None if the field is
+    missing or truncated (then fetch_all_comments must page the endpoint)."""
+    page = (issue.get("fields") or {}).get("comment")
+    if not isinstance(page, dict):
+        return None
+    comments = page.get("comments") or []
+    if page.get("total", 0) > len(comments):
+        return None
+    return comments
+
+
 def _maybe_updated_clause(last_ingested_at: Optional[str]) -> str:
     if FULL_REFRESH or not (INCREMENTAL and last_ingested_at):
         return ""
@@ -201,32 +387,53 @@ def _maybe_updated_clause(last_ingested_at: Optional[str]) -> str:
 def issues_in_epic(epic_key: str, last_ingested_at: Optional[str]) -> List[Dict[str, Any]]:
     """Find issues in an epic across common Jira project types."""
     updated_clause = _maybe_updated_clause(last_ingested_at)
-    fields = ["summary", "issuetype", "project", "subtasks", "updated"]
+    fields = ["summary", "issuetype", "project", "subtasks", "updated", "comment"]
 
-    all_issues: List[Dict[str, Any]] = []
-    seen: Set[str] = set()
-
-    jqls = [
-        f'"Epic Link" = {epic_key}{updated_clause}',  # company-managed epic link
-        f"parentEpic = {epic_key}{updated_clause}",   # team-managed
-        f"parent = {epic_key}{updated_clause}",       # parent link (child work items)
+    clauses = [
+        f'"Epic Link" = {epic_key}',  # company-managed epic link
+        f"parentEpic = {epic_key}",   # team-managed
+        f"parent = {epic_key}",       # parent link (child work items)
     ]
 
-    for jql in jqls:
-        try:
-            hits = jql_search(jql, fields=fields)
-            if DEBUG:
-                keys = [i.get("key") for i in hits if i.get("key")]
-                print(f"  JQL: {jql[:80]}... -> {len(hits)} hits: {keys[:10]}{'...' if len(keys) > 10 else ''}")
-        except requests.HTTPError as e:
+    # One OR query lets Jira return the de-duplicated union in a single pagination run
+    combined = f"({' OR '.join(clauses)}){updated_clause}"
+    all_issues: List[Dict[str, Any]]
+    try:
+        all_issues = jql_search(combined, fields=fields)
+        if DEBUG:
+            keys = [i.get("key") for i in all_issues if i.get("key")]
+            print(f"  JQL: {combined[:80]}... -> {len(all_issues)} hits: {keys[:10]}{'...' if len(keys) > 10 else ''}")
+    except requests.HTTPError as e:
+        # A clause unknown on this site (e.g. no "Epic Link" field) fails the whole query;
+        # fall back to running the clauses separately and keep whichever succeed
+        if DEBUG:
+            print(f"  JQL failed: {combined[:60]}... -> {e.response.status_code}; retrying clauses separately")
+        all_issues = []
+        jqls = [f"{clause}{updated_clause}" for clause in clauses]
+
+        def search(jql: str) -> Tuple[List[Dict[str, Any]], Optional[requests.HTTPError]]:
+            try:
+                return jql_search(jql, fields=fields), None
+            except requests.HTTPError as err:
+                return [], err
+
+        # The queries are independent; run them concurrently and merge in list order
+        with ThreadPoolExecutor(max_workers=len(jqls)) as pool:
+            results = list(pool.map(search, jqls))
+
+        seen: Set[str] = set()
+        for jql, (hits, err) in zip(jqls, results):
             if DEBUG:
-                print(f"  JQL failed: {jql[:60]}... -> {e.response.status_code} {e.response.text[:200]}")
-            hits = []
-        for issue in hits:
-            key = issue.get("key")
-            if key and key not in seen:
-                seen.add(key)
-                all_issues.append(issue)
+                if err is not None:
+                    print(f"  JQL failed: {jql[:60]}... -> {err.response.status_code} {err.response.text[:200]}")
+                else:
+                    keys = [i.get("key") for i in hits if i.get("key")]
+                    print(f"  JQL: {jql[:80]}... -> {len(hits)} hits: {keys[:10]}{'...' if len(keys) > 10 else ''}")
+            for issue in hits:
+                key = issue.get("key")
+                if key and key not in seen:
+                    seen.add(key)
+                    all_issues.append(issue)
 
     if DEBUG and all_issues:
         print(f"  Total issues found: {sorted(i.get('key') for i in all_issues if i.get('key'))}")
@@ -241,6 +448,24 @@ def db_connect(path: str) -> sqlite3.Connection:
     conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
+    # Bulk-ingest tuning: WAL + NORMAL syncs once per checkpoint instead of every commit
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA cache_size = -65536;")  # 64 MB
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA mmap_size = 268435456;")  # 256 MB
+    # Dedupe lookups (load_existing_refs) rely on this; the bundled schemas create it,
+    # but make sure DBs built from older/hand-rolled schemas have it too.
+    try:
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_events_source_ref ON events(source_type, source_ref)"
+        )
+    except sqlite3.IntegrityError:
+        # Existing duplicates block the index; ingest still dedupes against load_existing_refs
+        print(
+            "Warning: events has duplicate (source_type, source_ref) rows, so idx_events_source_ref "
+            "could not be created. Delete the duplicates (keep one row per source_ref) and rerun."
+        )
     return conn
 
 
@@ -274,16 +499,13 @@ def set_last_ingested_at(conn: sqlite3.Connection, project_id: str, ts: str) ->
     )
 
 
-def event_exists(conn: sqlite3.Connection, source_type: str, source_ref: str) -> bool:
-    row = conn.execute(
-        "SELECT 1 FROM events WHERE source_type=? AND source_ref=? LIMIT 1",
-        (source_type, source_ref),
-    ).fetchone()
-    return row is not None
+def load_existing_refs(conn: sqlite3.Connection, source_type: str) -> Set[str]:
+    """All source_refs already stored for a source, for in-memory dedupe checks."""
+    rows = conn.execute("SELECT source_ref FROM events WHERE source_type=?", (source_type,))
+    return {r[0] for r in rows}
 
 
-def insert_event(
-    conn: sqlite3.Connection,
+def event_row(
     *,
     event_id: str,
     source_type: str,
@@ -299,36 +521,57 @@ def insert_event(
     text: str,
     permalink: Optional[str],
     raw_obj: Dict[str, Any],
-) -> None:
-    conn.execute(
+) -> Tuple[Any, ...]:
+    """Build an events row in insert_events column order."""
+    return (
+        event_id,
+        source_type,
+        source_ref,
+        occurred_at,
+        ingested_at,
+        container_id,
+        container_name,
+        actor_id,
+        actor_display,
+        event_kind,
+        title,
+        text,
+        permalink,
+        dumps_json(raw_obj),
+    )
+
+
+def insert_multirow(conn: sqlite3.Connection, insert_sql: str, rows: List[Tuple[Any, ...]]) -> None:
+    """Run insert_sql (ending in VALUES) as multi-row INSERTs, each one staying
+    under SQLite's default 999 bound-parameter limit."""
+    if not rows:
+        return
+    ncols = len(rows[0])
+    per_stmt = SQLITE_MAX_VARIABLES // ncols
+    placeholder = "(" + ",".join("?" * ncols) + ")"
+    for i in range(0, len(rows), per_stmt):
+        chunk = rows[i:i + per_stmt]
+        conn.execute(
+            insert_sql + ",".join([placeholder] * len(chunk)),
+            [v for row in chunk for v in row],
+        )
+
+
+def insert_events(conn: sqlite3.Connection, rows: List[Tuple[Any, ...]]) -> None:
+    # idx_events_source_ref makes a duplicate (source_type, source_ref) a no-op
+    insert_multirow(
+        conn,
         """
-        INSERT INTO events(
+        INSERT OR IGNORE INTO events(
           event_id, source_type, source_ref, occurred_at, ingested_at,
           container_id, container_name, actor_id, actor_display,
           event_kind, title, text, permalink, raw_json
-        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-        """,
-        (
-            event_id,
-            source_type,
-            source_ref,
-            occurred_at,
-            ingested_at,
-            container_id,
-            container_name,
-            actor_id,
-            actor_display,
-            event_kind,
-            title,
-            text,
-            permalink,
-            json.dumps(raw_obj, ensure_ascii=False),
-        ),
+        ) VALUES """,
+        rows,
     )
 
 
-def link_event_to_project(
-    conn: sqlite3.Connection,
+def link_row(
     *,
     event_id: str,
     project_id: str,
@@ -336,25 +579,73 @@ def link_event_to_project(
     confidence: float,
     rationale: str,
     created_at: str,
-) -> None:
-    conn.execute(
+) -> Tuple[Any, ...]:
+    """Build an event_project_links row in link_events_to_projects column order."""
+    return (event_id, project_id, attribution_type, confidence, rationale, created_at)
+
+
+def link_events_to_projects(conn: sqlite3.Connection, rows: List[Tuple[Any, ...]]) -> None:
+    insert_multirow(
+        conn,
         """
         INSERT OR IGNORE INTO event_project_links(
           event_id, project_id, attribution_type, confidence, rationale, created_at
-        ) VALUES (?,?,?,?,?,?)
-        """,
-        (event_id, project_id, attribution_type, confidence, rationale, created_at),
+        ) VALUES """,
+        rows,
     )
 
 
+def flush_rows(
+    conn: sqlite3.Connection,
+    event_rows: List[Tuple[Any, ...]],
+    link_rows: List[Tuple[Any, ...]],
+) -> None:
+    """Write buffered events, then their links (FK order), and clear both buffers."""
+    if event_rows:
+        insert_events(conn, event_rows)
+        event_rows.clear()
+    if link_rows:
+        link_events_to_projects(conn, link_rows)
+        link_rows.clear()
+
+
+_EVENT_ID_TRANS = str.maketrans({":": "_", "/": "_"})
+
+
 def make_event_id(prefix: str, source_ref: str) -> str:
-    safe = source_ref.replace(":", "_").replace("/", "_")
-    return f"{prefix}_{safe}"[:120]
+    return f"{prefix}_{source_ref.translate(_EVENT_ID_TRANS)}"[:120]
 
 
 # -----------------------------
 # Ingestion logic
 # -----------------------------
+def fetch_issue_activity(
+    issue_key: str,
+    issue: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
+    """Network-only half of issue ingestion; safe to run on worker threads.
+    issue: the issue as returned by JQL search, if known; its fields are reused instead
+    of re-fetching the issue.
+    Returns (issue meta, changelog histories, comments, subtask keys)."""
+    if issue is None:
+        issue = fetch_issue_meta(issue_key)
+    histories = fetch_changelog(issue_key)
+
+    comments = inline_comments(issue)
+    if comments is None:
+        try:
+            comments = fetch_all_comments(issue_key)
+        except requests.HTTPError:
+            comments = []
+
+    # Both the JQL search and fetch_issue_meta request subtasks, so no extra fetch is needed
+    subtask_keys = [
+        st["key"] for st in ((issue.get("fields") or {}).get("subtasks") or []) if st.get("key")
+    ]
+
+    return issue, histories, comments, subtask_keys
+
+
 def ingest_issue_activity(
     conn: sqlite3.Connection,
     *,
@@ -362,10 +653,17 @@ def ingest_issue_activity(
     epic_key: str,
     issue_key: str,
     ingested_at: str,
+    issue: Dict[str, Any],
+    histories: List[Dict[str, Any]],
+    comments: List[Dict[str, Any]],
+    seen_refs: Set[str],
+    event_rows: List[Tuple[Any, ...]],
+    link_rows: List[Tuple[Any, ...]],
 ) -> Dict[str, int]:
+    """Buffer an issue's comments and status changes (already fetched) as event/link rows.
+    Buffers are flushed to the DB once they reach WRITE_BATCH_SIZE events."""
     counters = {"comments": 0, "status_changes": 0, "skipped_existing": 0}
 
-    issue = fetch_issue_with_changelog(issue_key)
     fields = issue.get("fields", {}) or {}
 
     proj = fields.get("project") or {}
@@ -375,18 +673,13 @@ def ingest_issue_activity(
     issue_url = f"{JIRA_BASE_URL}/browse/{issue_key}"
 
     # Comments
-    try:
-        comments = fetch_all_comments(issue_key)
-    except requests.HTTPError:
-        comments = []
-
     for c in comments:
         comment_id = c.get("id")
         if not comment_id:
             continue
 
         source_ref = f"{issue_key}:comment:{comment_id}"
-        if event_exists(conn, "jira", source_ref):
+        if source_ref in seen_refs:
             counters["skipped_existing"] += 1
             continue
 
@@ -405,8 +698,7 @@ def ingest_issue_activity(
         )
 
         event_id = make_event_id("jira", source_ref)
-        insert_event(
-            conn,
+        event_rows.append(event_row(
             event_id=event_id,
             source_type="jira",
             source_ref=source_ref,
@@ -421,21 +713,19 @@ def ingest_issue_activity(
             text=text,
             permalink=issue_url,
             raw_obj={"issueKey": issue_key, "comment": c},
-        )
-        link_event_to_project(
-            conn,
+        ))
+        seen_refs.add(source_ref)
+        link_rows.append(link_row(
             event_id=event_id,
             project_id=project_id,
             attribution_type="scope_rule",
             confidence=1.0,
             rationale=f"Issue belongs to epic {epic_key} (jira_epic scope)",
             created_at=ingested_at,
-        )
+        ))
         counters["comments"] += 1
 
     # Status changes from changelog
-    changelog = issue.get("changelog") or {}
-    histories = changelog.get("histories") or []
     for h in histories:
         history_id = h.get("id")
         created = h.get("created")
@@ -451,14 +741,13 @@ def ingest_issue_activity(
             from_s = it.get("fromString")
             to_s = it.get("toString")
             source_ref = f"{issue_key}:status:{history_id}:{idx}"
-            if event_exists(conn, "jira", source_ref):
+            if source_ref in seen_refs:
                 counters["skipped_existing"] += 1
                 continue
 
             text = f"{issue_key} status changed: {from_s} → {to_s}"
             event_id = make_event_id("jira", source_ref)
-            insert_event(
-                conn,
+            event_rows.append(event_row(
                 event_id=event_id,
                 source_type="jira",
                 source_ref=source_ref,
@@ -473,33 +762,50 @@ def ingest_issue_activity(
                 text=text,
                 permalink=issue_url,
                 raw_obj={"issueKey": issue_key, "history": h, "item": it},
-            )
-            link_event_to_project(
-                conn,
+            ))
+            seen_refs.add(source_ref)
+            link_rows.append(link_row(
                 event_id=event_id,
                 project_id=project_id,
                 attribution_type="scope_rule",
                 confidence=1.0,
                 rationale=f"Issue belongs to epic {epic_key} (jira_epic scope)",
                 created_at=ingested_at,
-            )
+            ))
             counters["status_changes"] += 1
 
+    if len(event_rows) >= WRITE_BATCH_SIZE:
+        flush_rows(conn, event_rows, link_rows)
+
     return counters
 
 
-def ingest_epic(conn: sqlite3.Connection, project_id: str, epic_key: str) -> Dict[str, int]:
+def ingest_epic(
+    conn: sqlite3.Connection,
+    project_id: str,
+    epic_key: str,
+    seen_refs: Optional[Set[str]] = None,
+    base_issues: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, int]:
+    """Ingest all child-issue activity for one epic.
+    seen_refs: source_refs already in events (loaded from the DB if not given); updated in place.
+    base_issues: issues_in_epic() result if already fetched; otherwise searched here."""
     counters = {"issues_touched": 0, "comments": 0, "status_changes": 0, "skipped_existing": 0}
     ingested_at = now_iso()
-
-    last_ingested_at = get_last_ingested_at(conn, project_id)
-    if DEBUG:
-        print(f"  last_ingested_at: {last_ingested_at}, INCREMENTAL: {INCREMENTAL}, FULL_REFRESH: {FULL_REFRESH}")
-
-    # Find child issues in epic (CLOPS-1447 -> CLOPS-1572 etc.)
-    if DEBUG:
-        print(f"  Running JQL to find issues in epic {epic_key}:")
-    base_issues = issues_in_epic(epic_key, last_ingested_at)
+    if seen_refs is None:
+        seen_refs = load_existing_refs(conn, "jira")
+
+    if base_issues is None:
+        last_ingested_at = get_last_ingested_at(conn, project_id)
+        if DEBUG:
+            print(f"  last_ingested_at: {last_ingested_at}, INCREMENTAL: {INCREMENTAL}, FULL_REFRESH: {FULL_REFRESH}")
+
+        # Find child issues in epic (CLOPS-1447 -> CLOPS-1572 etc.)
+        if DEBUG:
+            print(f"  Running JQL to find issues in epic {epic_key}:")
+        base_issues = issues_in_epic(epic_key, last_ingested_at)
+    # Search already returned project/summary fields for these; only subtasks and the epic need a fetch
+    issue_cache: Dict[str, Dict[str, Any]] = {i["key"]: i for i in base_issues if i.get("key")}
     issue_keys: Set[str] = {i["key"] for i in base_issues if i.get("key")}
 
     # Include subtasks from the search results
@@ -512,38 +818,59 @@ def ingest_epic(conn: sqlite3.Connection, project_id: str, epic_key: str) -> Dic
     # Include the epic itself
     issue_keys.add(epic_key)
 
-    processed: Set[str] = set()
-    while True:
-        pending = sorted(issue_keys - processed)
-        if not pending:
-            break
-
-        for issue_key in pending:
-            processed.add(issue_key)
-            counters["issues_touched"] += 1
+    # HTTP fan-out runs on a bounded thread pool; all DB writes stay on this thread.
+    # Subtasks found while fetching are submitted right away (no rescan pass).
+    event_rows: List[Tuple[Any, ...]] = []
+    link_rows: List[Tuple[Any, ...]] = []
+    with ThreadPoolExecutor(max_workers=JIRA_MAX_WORKERS) as pool:
+        futures: Dict[Future, str] = {}
 
-            c = ingest_issue_activity(
-                conn,
-                project_id=project_id,
-                epic_key=epic_key,
-                issue_key=issue_key,
-                ingested_at=ingested_at,
-            )
-            counters["comments"] += c["comments"]
-            counters["status_changes"] += c["status_changes"]
-            counters["skipped_existing"] += c["skipped_existing"]
+        def submit(key: str) -> None:
+            futures[pool.submit(fetch_issue_activity, key, issue_cache.get(key))] = key
 
-            # Discover subtasks from full issue fetch
-            try:
-                issue_full = fetch_issue_with_changelog(issue_key)
-                subs2 = ((issue_full.get("fields") or {}).get("subtasks") or [])
-                for st in subs2:
-                    k = st.get("key")
-                    if k:
-                        issue_keys.add(k)
-            except Exception:
-                pass
+        for issue_key in issue_keys:
+            submit(issue_key)
 
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    issue_key = futures.pop(fut)
+                    issue, histories, comments, subtask_keys = fut.result()
+                    counters["issues_touched"] += 1
+
+                    c = ingest_issue_activity(
+                        conn,
+                        project_id=project_id,
+                        epic_key=epic_key,
+                        issue_key=issue_key,
+                        ingested_at=ingested_at,
+                        issue=issue,
+                        histories=histories,
+                        comments=comments,
+                        seen_refs=seen_refs,
+                        event_rows=event_rows,
+                        link_rows=link_rows,
+                    )
+                    counters["comments"] += c["comments"]
+                    counters["status_changes"] += c["status_changes"]
+                    counters["skipped_existing"] += c["skipped_existing"]
+
+                    for k in subtask_keys:
+                        if k not in issue_keys:
+                            issue_keys.add(k)
+                            submit(k)
+                    if counters["issues_touched"] % COMMIT_EVERY_ISSUES == 0:
+                        # Checkpoint is only advanced at the end, so a rerun still revisits these issues
+                        flush_rows(conn, event_rows, link_rows)
+                        conn.commit()
+        except BaseException:
+            # Don't let the pool's shutdown wait on queued fetches before the error surfaces
+            for f in futures:
+                f.cancel()
+            raise
+
+    flush_rows(conn, event_rows, link_rows)
     set_last_ingested_at(conn, project_id, ingested_at)
     return counters
 
@@ -566,19 +893,33 @@ def main() -> None:
     print()
 
     total = {"issues_touched": 0, "comments": 0, "status_changes": 0, "skipped_existing": 0}
-
-    for project_id, epic_key in scopes:
-        print(f"== Ingesting epic {epic_key} for project {project_id} ==")
-        counters = ingest_epic(conn, project_id, epic_key)
-        conn.commit()
-        print(
-            f"  issues_touched: {counters['issues_touched']}\n"
-            f"  new comments:   {counters['comments']}\n"
-            f"  new statuses:   {counters['status_changes']}\n"
-            f"  skipped:        {counters['skipped_existing']}"
-        )
-        for k in total:
-            total[k] += counters[k]
+    seen_refs = load_existing_refs(conn, "jira")
+    # Checkpoints are read before any epic runs, so epics sharing a project all use the same window
+    checkpoints = [get_last_ingested_at(conn, project_id) for project_id, _ in scopes]
+
+    # Epic discovery is network-only, so every scope's JQL runs up front and overlaps earlier
+    # epics' ingestion. Issue writes stay on this thread: SQLite allows one writer at a time.
+    with ThreadPoolExecutor(max_workers=min(JIRA_MAX_WORKERS, len(scopes))) as discovery_pool:
+        discovery = [
+            discovery_pool.submit(issues_in_epic, epic_key, last_ingested_at)
+            for (_, epic_key), last_ingested_at in zip(scopes, checkpoints)
+        ]
+
+        for (project_id, epic_key), last_ingested_at, fut in zip(scopes, checkpoints, discovery):
+            print(f"== Ingesting epic {epic_key} for project {project_id} ==")
+            if DEBUG:
+                print(f"  last_ingested_at: {last_ingested_at}, INCREMENTAL: {INCREMENTAL}, FULL_REFRESH: {FULL_REFRESH}")
+            # Commits on success; on error rolls back the checkpoint and events since the last partial commit
+            with conn:
+                counters = ingest_epic(conn, project_id, epic_key, seen_refs, base_issues=fut.result())
+            print(
+                f"  issues_touched: {counters['issues_touched']}\n"
+                f"  new comments:   {counters['comments']}\n"
+                f"  new statuses:   {counters['status_changes']}\n"
+                f"  skipped:        {counters['skipped_existing']}"
+            )
+            for k in total:
+                total[k] += counters[k]
 
     print("== Done ==")
     print(
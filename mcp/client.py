@@ -3,7 +3,8 @@
 Lightweight synchronous MCP client that connects to a FastMCP server
 over SSE transport and invokes tools via JSON-RPC 2.0.
 
-Requires only the ``requests`` library (no fastmcp/mcp SDK needed).
+Requires only the ``requests`` library (no fastmcp/mcp SDK needed);
+``orjson`` is used for decoding messages when installed.
 
 Usage::
 
@@ -19,12 +20,23 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
+from functools import lru_cache
 from types import TracebackType
 from typing import Any, Optional
 
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers see the same errors
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 _DEFAULT_URL = "http://127.0.0.1:8000/sse"
 
@@ -33,7 +45,9 @@ class MCPClient:
     """Synchronous MCP-over-SSE client.
 
     Each instance opens one SSE session, performs the MCP handshake, and
-    can then call tools repeatedly until closed.
+    can then call tools repeatedly until closed. A background reader
+    thread routes responses to callers by JSON-RPC id, so tools may be
+    called concurrently from several threads.
     """
 
     def __init__(self, sse_url: str | None = None, *, timeout: int = 60):
@@ -44,10 +58,16 @@ class MCPClient:
         )
         self._base_url = self._sse_url.replace("/sse", "").rstrip("/")
         self._timeout = timeout
+        self._session: Optional[requests.Session] = None
         self._sse_resp: Optional[requests.Response] = None
         self._events = None
         self._message_url: Optional[str] = None
         self._next_id = 1
+        self._lock = threading.Lock()
+        self._pending: dict[int, Future] = {}
+        self._reader: Optional[threading.Thread] = None
+        # Set by the reader thread once the stream ends; later calls fail fast with it
+        self._closed_error: Optional[BaseException] = None
 
     # ── context manager ──────────────────────────────────────────────
 
@@ -67,7 +87,10 @@ class MCPClient:
 
     def connect(self) -> None:
         """Open SSE stream and complete the MCP initialize handshake."""
-        self._sse_resp = requests.get(
+        self._closed_error = None
+        # One keep-alive session for the stream and every JSON-RPC POST
+        self._session = requests.Session()
+        self._sse_resp = self._session.get(
             f"{self._base_url}/sse",
             stream=True,
             headers={"Accept": "text/event-stream", "Cache-Control": "no-store"},
@@ -87,6 +110,11 @@ class MCPClient:
         if not self._message_url:
             raise RuntimeError("MCP server did not provide a message endpoint")
 
+        self._reader = threading.Thread(
+            target=self._read_loop, args=(self._events,), daemon=True
+        )
+        self._reader.start()
+
         self._rpc("initialize", {
             "protocolVersion": "2024-11-05",
             "capabilities": {},
@@ -102,6 +130,12 @@ class MCPClient:
         if self._sse_resp is not None:
             self._sse_resp.close()
             self._sse_resp = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._reader is not None:
+            self._reader.join(timeout=1)
+            self._reader = None
         self._events = None
         self._message_url = None
 
@@ -119,7 +153,7 @@ class MCPClient:
     # ── internals ────────────────────────────────────────────────────
 
     def _post(self, body: dict) -> None:
-        requests.post(
+        self._session.post(
             self._message_url,
             json=body,
             timeout=self._timeout,
@@ -127,71 +161,169 @@ class MCPClient:
 
     def _rpc(self, method: str, params: dict) -> dict:
         """Send a JSON-RPC request and wait for the matching response."""
-        msg_id = self._next_id
-        self._next_id += 1
-
-        self._post({
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "method": method,
-            "params": params,
-        })
-
-        for etype, edata in self._events:
-            if etype == "message":
-                msg = json.loads(edata)
-                if msg.get("id") == msg_id:
-                    if "error" in msg:
-                        err = msg["error"]
-                        raise RuntimeError(
-                            f"MCP error {err.get('code')}: {err.get('message')}"
-                        )
-                    return msg.get("result", {})
-
-        raise RuntimeError("No response received from MCP server")
+        fut: Future = Future()
+        with self._lock:
+            # Checked under the lock the reader drains _pending with, so a request is
+            # either failed by the reader or refused here, never left waiting
+            if self._closed_error is not None:
+                raise self._closed_error
+            msg_id = self._next_id
+            self._next_id += 1
+            self._pending[msg_id] = fut
+
+        try:
+            self._post({
+                "jsonrpc": "2.0",
+                "id": msg_id,
+                "method": method,
+                "params": params,
+            })
+            msg = fut.result(timeout=self._timeout)
+        except FutureTimeoutError:
+            raise RuntimeError("No response received from MCP server") from None
+        finally:
+            with self._lock:
+                self._pending.pop(msg_id, None)
+
+        if "error" in msg:
+            err = msg["error"]
+            raise RuntimeError(
+                f"MCP error {err.get('code')}: {err.get('message')}"
+            )
+        return msg.get("result", {})
+
+    def _read_loop(self, events) -> None:
+        """Resolve pending requests from the SSE stream until it ends."""
+        error: BaseException = RuntimeError("No response received from MCP server")
+        try:
+            for etype, edata in events:
+                if etype != "message":
+                    continue
+                msg = _json_loads(edata)
+                if not isinstance(msg, dict):  # batches/scalars carry no response for us
+                    continue
+                with self._lock:
+                    fut = self._pending.pop(msg.get("id"), None)
+                if fut is not None:
+                    fut.set_result(msg)
+        except Exception as e:  # stream closed or broken; fail whoever is waiting
+            error = e
+        with self._lock:
+            self._closed_error = error
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for fut in pending:
+            fut.set_exception(error)
+
+
+_EVENT = b"event:"
+_DATA = b"data:"
+_EOL = re.compile(rb"\r\n|\r|\n")  # SSE allows CRLF, LF or a bare CR
 
 
 def _iter_sse(response: requests.Response):
-    """Yield (event_type, data) tuples from a streaming requests response."""
+    """Yield (event_type, data) tuples from a streaming requests response.
+
+    Reads chunks as they arrive (``iter_lines`` blocks until its 512-byte
+    chunk fills) and splits lines on bytes, decoding only event/data fields.
+    Only bytes received since the last line break are rescanned, so a long
+    event spread over many chunks stays linear.
+    """
     event_type = None
     data_lines: list[str] = []
-    for raw in response.iter_lines(decode_unicode=True):
-        if raw == "":
-            if data_lines:
-                yield (event_type or "message", "\n".join(data_lines))
-            event_type = None
-            data_lines = []
-        elif raw.startswith("event:"):
-            event_type = raw[len("event:"):].strip()
-        elif raw.startswith("data:"):
-            data_lines.append(raw[len("data:"):].strip())
+    buf = bytearray()
+    scan = 0  # buf[:scan] is known to hold no line break
+    split_crlf = False  # last chunk ended in CR; a leading LF completes that CRLF
+    for chunk in response.iter_content(chunk_size=None):
+        if split_crlf and chunk.startswith(b"\n"):
+            chunk = chunk[1:]
+        buf += chunk
+        start = 0
+        split_crlf = False
+        for m in _EOL.finditer(buf, scan):
+            split_crlf = m.end() == len(buf) and m.group() == b"\r"
+            raw = bytes(buf[start:m.start()])
+            start = m.end()
+            if not raw:
+                if data_lines:
+                    yield (event_type or "message", "\n".join(data_lines))
+                event_type = None
+                data_lines = []
+            elif raw.startswith(_EVENT):
+                event_type = raw[len(_EVENT):].strip().decode()
+            elif raw.startswith(_DATA):
+                data_lines.append(raw[len(_DATA):].strip().decode())
+        del buf[:start]
+        scan = len(buf)
 
 
 # ── response formatting ─────────────────────────────────────────────
 
 
-def _humanize_ts(raw: str) -> str:
-    """Convert an ISO-8601 timestamp to a human-friendly relative string."""
+@lru_cache(maxsize=4096)
+def _parse_ts(raw: str) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp as UTC-aware; None if unparseable.
+
+    Cached because event feeds repeat the same timestamps across renders.
+    """
     try:
         clean = raw.split(".")[0].replace("Z", "+00:00")
         if "+" not in clean and "-" not in clean[10:]:
             clean += "+00:00"
         dt = datetime.fromisoformat(clean)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        delta = datetime.now(timezone.utc) - dt
-        secs = delta.total_seconds()
-        if secs < 60:
-            return "just now"
-        if secs < 3600:
-            return f"{int(secs / 60)}m ago"
-        if secs < 86400:
-            return f"{int(secs / 3600)}h ago"
-        if delta.days < 7:
-            return f"{delta.days}d ago"
-        return dt.strftime("%b %d")
     except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _humanize_ts(raw: str) -> str:
+    """Convert an ISO-8601 timestamp to a human-friendly relative string."""
+    dt = _parse_ts(raw)
+    if dt is None:
         return raw
+    delta = datetime.now(timezone.utc) - dt
+    secs = delta.total_seconds()
+    if secs < 60:
+        return "just now"
+    if secs < 3600:
+        return f"{int(secs / 60)}m ago"
+    if secs < 86400:
+        return f"{int(secs / 3600)}h ago"
+    if delta.days < 7:
+        return f"{delta.days}d ago"
+    return dt.strftime("%b %d")
+
+
+# Applied in order by format_response; later passes see earlier rewrites.
+_RE_ATTRIBUTION = re.compile(r"\n\s*_Attribution:.*_")
+_RE_PULSE_EVIDENCE = re.compile(r"  → \[(\w+)\]\(([^)]+)\) — _.*_")
+_RE_BLOCKER_SOURCE = re.compile(r"(- \*\*Source:\*\* \[[^\]]+\]\([^)]+\))\n\s+_.*_")
+_RE_EVENT_HEADER = re.compile(r"- \*\*\[(\w+)\]\*\* (\S+) \| ([^ |]+) \| (\w+)(.*)")
+_RE_LINK = re.compile(r"\n\s+\[Link\]\(([^)]+)\)")
+_RE_LAST_ACTIVITY = re.compile(r"(\*\*Last activity:\*\* )(\S+)")
+_RE_SNAPSHOT = re.compile(r"\*Snapshot: (\S+)\*")
+_RE_WINDOW = re.compile(r"\*Window: (\S+) → (\S+)\*")
+_RE_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def _fmt_event(m: re.Match) -> str:
+    source, ts, actor = m.group(1), m.group(2), m.group(3)
+    rest = (m.group(5) or "").strip()
+    rest = f" {rest}" if rest else ""
+    return f"- **{actor}** · {_humanize_ts(ts)} · {source}{rest}"
+
+
+def _fmt_window(m: re.Match) -> str:
+    start = datetime.fromisoformat(
+        m.group(1).split(".")[0].replace("Z", "+00:00")
+    )
+    end = datetime.fromisoformat(
+        m.group(2).split(".")[0].replace("Z", "+00:00")
+    )
+    fmt = "%b %d"
+    return f"*Window: {start.strftime(fmt)} → {end.strftime(fmt)}*"
 
 
 def format_response(text: str) -> str:
@@ -204,69 +336,38 @@ def format_response(text: str) -> str:
     """
 
     # ── strip attribution metadata ───────────────────────────────────
-    text = re.sub(r"\n\s*_Attribution:.*_", "", text)
+    text = _RE_ATTRIBUTION.sub("", text)
 
     # ── pulse / changes evidence lines ───────────────────────────────
     # "  → [Slack](url) — _duplicate snippet_"  →  "  [📎 Slack](url)"
-    text = re.sub(
-        r"  → \[(\w+)\]\(([^)]+)\) — _.*_",
-        r"  [📎 \1](\2)",
-        text,
-    )
+    text = _RE_PULSE_EVIDENCE.sub(r"  [📎 \1](\2)", text)
 
     # ── blocker evidence blocks ──────────────────────────────────────
     # "- **Source:** [Slack — actor](url)\n  _dup text_"  →  single line
-    text = re.sub(
-        r"(- \*\*Source:\*\* \[[^\]]+\]\([^)]+\))\n\s+_.*_",
-        r"\1",
-        text,
-    )
+    text = _RE_BLOCKER_SOURCE.sub(r"\1", text)
 
     # ── event feed header ────────────────────────────────────────────
     # "- **[Slack]** 2026-02-27T... | actor | kind — Title"
     #  →  "- **actor** · 3h ago · Slack — Title"
-    def _fmt_event(m: re.Match) -> str:
-        source, ts, actor = m.group(1), m.group(2), m.group(3)
-        rest = (m.group(5) or "").strip()
-        rest = f" {rest}" if rest else ""
-        return f"- **{actor}** · {_humanize_ts(ts)} · {source}{rest}"
-
-    text = re.sub(
-        r"- \*\*\[(\w+)\]\*\* (\S+) \| ([^ |]+) \| (\w+)(.*)",
-        _fmt_event,
-        text,
-    )
+    text = _RE_EVENT_HEADER.sub(_fmt_event, text)
 
     # ── standalone [Link](url) → inline  ─────────────────────────────
-    text = re.sub(r"\n\s+\[Link\]\(([^)]+)\)", r" [📎](\1)", text)
+    text = _RE_LINK.sub(r" [📎](\1)", text)
 
     # ── humanize "Last activity" timestamps ──────────────────────────
-    text = re.sub(
-        r"(\*\*Last activity:\*\* )(\S+)",
+    text = _RE_LAST_ACTIVITY.sub(
         lambda m: m.group(1) + _humanize_ts(m.group(2)),
         text,
     )
 
     # ── humanize snapshot / window timestamps ────────────────────────
-    text = re.sub(
-        r"\*Snapshot: (\S+)\*",
+    text = _RE_SNAPSHOT.sub(
         lambda m: f"*Snapshot: {_humanize_ts(m.group(1))}*",
         text,
     )
-
-    def _fmt_window(m: re.Match) -> str:
-        start = datetime.fromisoformat(
-            m.group(1).split(".")[0].replace("Z", "+00:00")
-        )
-        end = datetime.fromisoformat(
-            m.group(2).split(".")[0].replace("Z", "+00:00")
-        )
-        fmt = "%b %d"
-        return f"*Window: {start.strftime(fmt)} → {end.strftime(fmt)}*"
-
-    text = re.sub(r"\*Window: (\S+) → (\S+)\*", _fmt_window, text)
+    text = _RE_WINDOW.sub(_fmt_window, text)
 
     # ── collapse excessive blank lines ───────────────────────────────
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _RE_BLANK_LINES.sub("\n\n", text)
 
     return text.strip()
@@ -11,14 +11,53 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
 import json
 import os
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
 
 import requests
 from fastmcp import FastMCP
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 API_BASE = os.environ.get("PROJECTPULSE_API_URL", "http://0.0.0.0:5050")
+# Seconds an identical API GET is served from memory; 0 disables the cache
+CACHE_TTL = float(os.environ.get("PROJECTPULSE_MCP_CACHE_TTL", "30"))
+CACHE_MAXSIZE = 512
+
+_PULSE_LABELS = {
+    "progress": "Progress",
+    "blockers": "Blockers",
+    "decisions": "Decisions",
+    "next_steps": "Upcoming / Next Steps",
+    "risks": "Risks",
+}
+# (section key, rendered header) pairs, built once instead of per call
+_PULSE_SECTIONS = tuple((k, f"## {v}") for k, v in _PULSE_LABELS.items())
+_ASK_PULSE_SECTIONS = tuple((k, f"### {v}") for k, v in _PULSE_LABELS.items())
+_CHANGES_SECTIONS = (
+    ("newly_completed", "## Newly Completed"),
+    ("new_blockers", "## New Blockers"),
+    ("new_decisions", "## New Decisions"),
+    ("other_activity", "## Other Activity"),
+)
+_ICON = {"slack": "Slack", "jira": "Jira"}
+# Advertised in tools/list _meta for tools whose output only changes on
+# re-ingestion, so clients may keep results in an ephemeral prompt cache.
+# Pulse/changes/blockers/ask track fresh snapshots and carry no hint.
+_CACHEABLE_META = {"cache_hint": "ephemeral"}
 
 mcp = FastMCP(
     name="ProjectPulse",
@@ -31,14 +70,111 @@ mcp = FastMCP(
 )
 
 
-def _api_get(path: str, params: dict | None = None) -> dict:
-    resp = requests.get(f"{API_BASE}{path}", params=params, timeout=10)
+def _make_session() -> requests.Session:
+    """Keep-alive session for the local Flask API, retrying brief restarts."""
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+atexit.register(_SESSION.close)
+
+
+# key -> (expires_at, value); LRU order, oldest first. Holds both API
+# responses, keyed (path, sorted params), and rendered tool output, keyed
+# ("tool", name, args, sorted kwargs), so one TTL and one clear cover both.
+_cache: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+_MISS = object()
+
+
+def _cache_get(key: tuple) -> Any:
+    if CACHE_TTL <= 0:
+        return _MISS
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            _cache.move_to_end(key)
+            return hit[1]
+    return _MISS
+
+
+def _cache_put(key: tuple, value: Any) -> None:
+    if CACHE_TTL <= 0:
+        return
+    with _cache_lock:
+        _cache[key] = (time.monotonic() + CACHE_TTL, value)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+
+
+def _hashable(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _cached_tool(fn):
+    """Memoize a tool's rendered Markdown, skipping both the API call and formatting."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = (
+            "tool", fn.__name__,
+            tuple(_hashable(a) for a in args),
+            tuple(sorted((k, _hashable(v)) for k, v in kwargs.items())),
+        )
+        text = _cache_get(key)
+        if text is _MISS:
+            text = await fn(*args, **kwargs)
+            _cache_put(key, text)
+        return text
+    return wrapper
+
+
+# path -> GET prepared once against _SESSION (headers, auth); copied per call
+_PREPARED: dict[str, requests.PreparedRequest] = {}
+
+
+def _fetch(path: str, params: dict | None = None) -> dict:
+    """Blocking GET against the Flask API; run off the event loop via _api_get.
+
+    Sends a copy of a per-path prepared request straight through
+    ``Session.send``, skipping the per-call header/hook merging and the
+    proxy/CA environment lookups of ``Session.get`` (API_BASE is local).
+    """
+    template = _PREPARED.get(path)
+    if template is None:
+        template = _SESSION.prepare_request(requests.Request("GET", f"{API_BASE}{path}"))
+        _PREPARED[path] = template
+    req = template.copy()
+    if params:
+        req.prepare_url(req.url, params)
+    resp = _SESSION.send(req, timeout=10, allow_redirects=False)
     resp.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(resp.content)
     return resp.json()
 
 
-@mcp.tool()
-def list_projects() -> str:
+async def _api_get(path: str, params: dict | None = None) -> dict:
+    key = (path, tuple(sorted((params or {}).items())))
+    data = _cache_get(key)
+    if data is not _MISS:
+        return data
+
+    # requests blocks, so it runs on a worker thread and concurrent tool calls overlap
+    data = await asyncio.to_thread(_fetch, path, params)
+    _cache_put(key, data)
+    return data
+
+
+@mcp.tool(meta=_CACHEABLE_META)
+@_cached_tool
+async def list_projects() -> str:
     """List all active projects tracked by ProjectPulse.
 
     Use this tool when the user asks:
@@ -48,7 +184,7 @@ def list_projects() -> str:
 
     Returns a JSON list of projects with their IDs, names, and descriptions.
     """
-    data = _api_get("/api/projects")
+    data = await _api_get("/api/projects")
     projects = data.get("projects", [])
     if not projects:
         return "No active projects found."
@@ -62,7 +198,8 @@ def list_projects() -> str:
 
 
 @mcp.tool()
-def get_project_pulse(project_id: str) -> str:
+@_cached_tool
+async def get_project_pulse(project_id: str) -> str:
     """Get the current status pulse for a project — a structured summary
     with progress, blockers, decisions, next steps, and risks.
 
@@ -81,14 +218,19 @@ def get_project_pulse(project_id: str) -> str:
                     Use list_projects first if you don't know the ID.
     """
     try:
-        data = _api_get("/api/pulse", params={"project_id": project_id})
+        data = await _api_get("/api/pulse", params={"project_id": project_id})
     except requests.HTTPError as exc:
         if exc.response is not None and exc.response.status_code == 404:
             return f"Project `{project_id}` not found. Use list_projects to see available projects."
         raise
 
+    return _format_pulse(data)
+
+
+def _format_pulse(data: dict) -> str:
+    """Render one /api/pulse payload as Markdown."""
     if data.get("snapshot_at") is None:
-        return f"No status snapshot available yet for **{data.get('project_name', project_id)}**."
+        return f"No status snapshot available yet for **{data.get('project_name', data.get('project_id'))}**."
 
     lines = [
         f"# {data['project_name']} — Status Pulse",
@@ -97,25 +239,18 @@ def get_project_pulse(project_id: str) -> str:
         f"**{data['headline']}**\n",
     ]
 
-    section_labels = {
-        "progress": "Progress",
-        "blockers": "Blockers",
-        "decisions": "Decisions",
-        "next_steps": "Upcoming / Next Steps",
-        "risks": "Risks",
-    }
-
     sections = data.get("sections", {})
-    for key, label in section_labels.items():
+    for key, header in _PULSE_SECTIONS:
         items = sections.get(key, [])
         if not items:
             continue
-        lines.append(f"## {label}")
+        lines.append(header)
         for item in items:
-            owner = f" (Owner: {item['owner']})" if item.get("owner") else ""
+            owner = item.get("owner")
+            owner = f" (Owner: {owner})" if owner else ""
             lines.append(f"- {item['text']}{owner}")
             for ev in item.get("evidence", []):
-                icon = "Slack" if ev["source_type"] == "slack" else "Jira"
+                icon = _ICON.get(ev["source_type"], "Jira")
                 lines.append(f"  → [{icon}]({ev['permalink']}) — _{ev['snippet']}_")
         lines.append("")
 
@@ -123,7 +258,53 @@ def get_project_pulse(project_id: str) -> str:
 
 
 @mcp.tool()
-def get_project_events(
+@_cached_tool
+async def get_multi_project_pulse(project_ids: list[str]) -> str:
+    """Get the status pulse for several projects in one call.
+
+    Use this tool when the user asks:
+    - "How are all my projects doing?"
+    - "Compare the status of <project A> and <project B>"
+    - "Give me a portfolio summary"
+
+    Prefer this over calling get_project_pulse once per project.
+
+    Args:
+        project_ids: Project identifiers (e.g. ["proj_incidentops", "proj_mvp"]).
+                     Use list_projects first if you don't know the IDs.
+    """
+    if not project_ids:
+        return "No project IDs given. Use list_projects to see available projects."
+
+    try:
+        data = await _api_get("/api/pulse/batch", params={"project_ids": ",".join(project_ids)})
+        pulses, not_found = data.get("pulses", []), data.get("not_found", [])
+    except requests.HTTPError as exc:
+        if exc.response is None or exc.response.status_code != 404:
+            raise
+        # Older API without the batch endpoint: fetch each pulse concurrently instead
+        async def fetch(pid: str) -> dict | None:
+            try:
+                return await _api_get("/api/pulse", params={"project_id": pid})
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code == 404:
+                    return None
+                raise
+
+        results = await asyncio.gather(*(fetch(pid) for pid in project_ids))
+        pulses = [r for r in results if r is not None]
+        not_found = [pid for pid, r in zip(project_ids, results) if r is None]
+
+    blocks = [_format_pulse(p) for p in pulses]
+    if not_found:
+        missing = ", ".join(f"`{pid}`" for pid in not_found)
+        blocks.append(f"Not found: {missing}. Use list_projects to see available projects.")
+    return "\n\n".join(blocks)
+
+
+@mcp.tool(meta=_CACHEABLE_META)
+@_cached_tool
+async def get_project_events(
     project_id: str,
     source_type: Optional[str] = None,
     limit: int = 20,
@@ -147,21 +328,28 @@ def get_project_events(
         params["source_type"] = source_type
 
     try:
-        data = _api_get("/api/events", params=params)
+        data = await _api_get("/api/events", params=params)
     except requests.HTTPError as exc:
         if exc.response is not None and exc.response.status_code == 404:
             return f"Project `{project_id}` not found. Use list_projects to see available projects."
         raise
 
-    events = data.get("events", [])
-    if not events:
+    if not data.get("events"):
         return f"No events found for **{data.get('project_name', project_id)}**."
 
+    # Up to 200 events of string building; keep it off the event loop
+    return await asyncio.to_thread(_format_events, data)
+
+
+def _format_events(data: dict) -> str:
+    """Render one /api/events payload as Markdown."""
+    events = data.get("events", [])
+
     lines = [
         f"# {data['project_name']} — Recent Events ({data['total']} total)\n"
     ]
     for ev in events:
-        icon = "Slack" if ev["source_type"] == "slack" else "Jira"
+        icon = _ICON.get(ev["source_type"], "Jira")
         title = f" — {ev['title']}" if ev.get("title") else ""
         lines.append(
             f"- **[{icon}]** {ev['occurred_at']} | {ev['actor']} | {ev['event_kind']}{title}"
@@ -169,9 +357,9 @@ def get_project_events(
         lines.append(f"  {ev['text']}")
         if ev.get("permalink"):
             lines.append(f"  [Link]({ev['permalink']})")
-        conf = ev["attribution"]["confidence"]
+        attribution = ev["attribution"]
         lines.append(
-            f"  _Attribution: {ev['attribution']['type']} (confidence {conf:.0%})_"
+            f"  _Attribution: {attribution['type']} (confidence {attribution['confidence']:.0%})_"
         )
         lines.append("")
 
@@ -179,7 +367,8 @@ def get_project_events(
 
 
 @mcp.tool()
-def get_project_changes(
+@_cached_tool
+async def get_project_changes(
     project_id: str,
     since: str,
 ) -> str:
@@ -203,7 +392,7 @@ def get_project_changes(
                (e.g. "2026-02-23" or "2026-02-23T00:00:00Z").
     """
     try:
-        data = _api_get("/api/changes", params={
+        data = await _api_get("/api/changes", params={
             "project_id": project_id,
             "since": since,
         })
@@ -223,21 +412,14 @@ def get_project_changes(
         f"*{total} events detected*\n",
     ]
 
-    section_labels = {
-        "newly_completed": "Newly Completed",
-        "new_blockers": "New Blockers",
-        "new_decisions": "New Decisions",
-        "other_activity": "Other Activity",
-    }
-
     sections = data.get("sections", {})
-    for key, label in section_labels.items():
+    for key, header in _CHANGES_SECTIONS:
         items = sections.get(key, [])
         if not items:
             continue
-        lines.append(f"## {label}")
+        lines.append(header)
         for ev in items:
-            icon = "Slack" if ev["source_type"] == "slack" else "Jira"
+            icon = _ICON.get(ev["source_type"], "Jira")
             lines.append(f"- {ev['text']} ({ev['actor']})")
             if ev.get("permalink"):
                 lines.append(f"  → [{icon}]({ev['permalink']})")
@@ -260,7 +442,8 @@ def get_project_changes(
 
 
 @mcp.tool()
-def get_project_blockers(project_id: str) -> str:
+@_cached_tool
+async def get_project_blockers(project_id: str) -> str:
     """Get all active blockers for a project with ownership and evidence.
     Combines snapshot-declared blockers with auto-detected blockers from
     recent Slack messages and Jira updates.
@@ -280,7 +463,7 @@ def get_project_blockers(project_id: str) -> str:
                     Use list_projects first if you don't know the ID.
     """
     try:
-        data = _api_get("/api/blockers", params={"project_id": project_id})
+        data = await _api_get("/api/blockers", params={"project_id": project_id})
     except requests.HTTPError as exc:
         if exc.response is not None and exc.response.status_code == 404:
             return f"Project `{project_id}` not found. Use list_projects to see available projects."
@@ -302,7 +485,7 @@ def get_project_blockers(project_id: str) -> str:
         lines.append(f"- **Last activity:** {last}")
 
         for ev in b.get("evidence", []):
-            icon = "Slack" if ev["source_type"] == "slack" else "Jira"
+            icon = _ICON.get(ev["source_type"], "Jira")
             lines.append(f"- **Source:** [{icon} — {ev['actor']}]({ev['permalink']})")
             lines.append(f"  _{ev['text']}_")
         lines.append("")
@@ -310,8 +493,10 @@ def get_project_blockers(project_id: str) -> str:
     return "\n".join(lines)
 
 
+# Not wrapped in _cached_tool: free-form questions rarely repeat verbatim, so the
+# rendered briefing would only crowd the LRU; its API calls are still cached.
 @mcp.tool()
-def ask_project(project_id: str, question: str) -> str:
+async def ask_project(project_id: str, question: str) -> str:
     """Answer any free-form question about a project using real data.
     This is the most powerful tool — it retrieves the full project
     context (status pulse, blockers, recent activity, statistics) and
@@ -339,7 +524,7 @@ def ask_project(project_id: str, question: str) -> str:
         question: The user's question, in their own words.
     """
     try:
-        data = _api_get("/api/ask", params={
+        data = await _api_get("/api/ask", params={
             "project_id": project_id,
             "question": question,
         })
@@ -365,23 +550,18 @@ def ask_project(project_id: str, question: str) -> str:
         if pulse.get("headline"):
             lines.append(f"**{pulse['headline']}**\n")
 
-        section_labels = {
-            "progress": "Progress",
-            "blockers": "Blockers",
-            "decisions": "Decisions",
-            "next_steps": "Upcoming / Next Steps",
-            "risks": "Risks",
-        }
-        for key, label in section_labels.items():
-            items = pulse.get("sections", {}).get(key, [])
+        sections = pulse.get("sections", {})
+        for key, header in _ASK_PULSE_SECTIONS:
+            items = sections.get(key, [])
             if not items:
                 continue
-            lines.append(f"### {label}")
+            lines.append(header)
             for item in items:
-                owner = f" (Owner: {item['owner']})" if item.get("owner") else ""
+                owner = item.get("owner")
+                owner = f" (Owner: {owner})" if owner else ""
                 lines.append(f"- {item['text']}{owner}")
                 for ev in item.get("evidence", []):
-                    icon = "Slack" if ev["source_type"] == "slack" else "Jira"
+                    icon = _ICON.get(ev["source_type"], "Jira")
                     lines.append(
                         f"  → [{icon}]({ev['permalink']}) — _{ev['snippet']}_"
                     )
@@ -397,7 +577,7 @@ def ask_project(project_id: str, question: str) -> str:
             owner = b.get("owner") or "Unassigned"
             lines.append(f"{i}. **{b['summary']}** (Owner: {owner})")
             for ev in b.get("evidence", []):
-                icon = "Slack" if ev["source_type"] == "slack" else "Jira"
+                icon = _ICON.get(ev["source_type"], "Jira")
                 lines.append(f"   → [{icon}]({ev['permalink']}) — _{ev['text']}_")
         lines.append("")
 
@@ -406,7 +586,7 @@ def ask_project(project_id: str, question: str) -> str:
     if events:
         lines.append(f"## Recent Activity ({len(events)} most recent)")
         for ev in events:
-            icon = "Slack" if ev["source_type"] == "slack" else "Jira"
+            icon = _ICON.get(ev["source_type"], "Jira")
             title = f" — {ev['title']}" if ev.get("title") else ""
             link = f" [link]({ev['permalink']})" if ev.get("permalink") else ""
             lines.append(
@@ -430,6 +610,22 @@ def ask_project(project_id: str, question: str) -> str:
     return "\n".join(lines)
 
 
+@mcp.tool()
+async def invalidate_cache() -> str:
+    """Clear cached ProjectPulse API responses so the next tool call
+    fetches fresh data.
+
+    Use this tool when the user asks:
+    - "Refresh the data"
+    - "That looks stale, check again"
+    - "I just re-ran ingestion, what's new?"
+    """
+    with _cache_lock:
+        count = len(_cache)
+        _cache.clear()
+    return f"Cleared {count} cached API responses and tool results."
+
+
 def run_mcp(transport: str = "sse", host: str = "0.0.0.0", port: int = 8000):
     mcp.run(transport=transport, host=host, port=port)
 
@@ -12,18 +12,23 @@ Usage:
     python run.py --flask-port 5050 --mcp-port 8000 --ui-port 8501
     python run.py --no-ui              # skip Streamlit UI
     python run.py --no-inspector       # skip MCP Inspector
+    python run.py --minimal            # only Flask API + MCP Server
 
 Press Ctrl+C to stop all services.
 """
 
 import argparse
+import http.client
 import os
 import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
-import urllib.request
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
 
@@ -42,25 +47,67 @@ MCP_VENV_PYTHON = (
     else _venv_python()
 )
 
-FLASK_APP = os.path.join(ROOT, "API", "app.py")
+FLASK_APP = os.path.join(ROOT, "api", "app.py")
 MCP_SERVER = os.path.join(ROOT, "mcp", "server.py")
 STREAMLIT_APP = os.path.join(ROOT, "app.py")
 
 NPX = shutil.which("npx")
 
 
-def wait_for_http(url: str, timeout: int = 15) -> bool:
-    """Block until an HTTP endpoint responds with 200."""
+def wait_for_http(
+    url: str,
+    timeout: int = 15,
+    stop: Optional[threading.Event] = None,
+    proc: Optional[subprocess.Popen] = None,
+) -> bool:
+    """Block until an HTTP endpoint responds with 200 (or `stop` is set, or `proc` exits).
+
+    Probes over one keep-alive connection, backing off from 50ms to 500ms
+    between attempts so a fast service is noticed almost immediately.
+    Only the status line and headers are awaited, so streaming endpoints
+    such as the MCP server's /sse count as ready.
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=2)
     deadline = time.time() + timeout
-    while time.time() < deadline:
-        try:
-            resp = urllib.request.urlopen(url, timeout=2)
-            if resp.status == 200:
-                return True
-        except Exception:
-            pass
-        time.sleep(0.5)
-    return False
+    delay = 0.05
+    try:
+        while time.time() < deadline and not (stop is not None and stop.is_set()):
+            if proc is not None and proc.poll() is not None:
+                return False
+            try:
+                conn.request("GET", path)
+                resp = conn.getresponse()
+                if resp.status == 200:
+                    return True
+                resp.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()  # reconnect on the next attempt
+            if stop is not None:
+                stop.wait(delay)
+            else:
+                time.sleep(delay)
+            delay = min(0.5, delay * 2)
+        return False
+    finally:
+        conn.close()
+
+
+def _stop_group(p: subprocess.Popen, force: bool = False) -> None:
+    """Stop a service and any helpers it spawned (npx's Node, Streamlit's watcher)."""
+    try:
+        if hasattr(os, "killpg"):
+            # start_new_session made the child its own group leader
+            os.killpg(p.pid, signal.SIGKILL if force else signal.SIGTERM)
+        elif force:
+            p.kill()
+        else:
+            p.terminate()
+    except OSError:
+        pass
 
 
 def main():
@@ -72,7 +119,10 @@ def main():
     parser.add_argument("--no-ui", action="store_true", help="Skip launching the Streamlit UI")
     parser.add_argument("--no-mcp", action="store_true", help="Skip launching the MCP Server")
     parser.add_argument("--no-inspector", action="store_true", help="Skip launching MCP Inspector")
+    parser.add_argument("--minimal", action="store_true", help="Only Flask API + MCP Server (same as --no-ui --no-inspector)")
     args = parser.parse_args()
+    if args.minimal:
+        args.no_ui = args.no_inspector = True
 
     flask_port = args.flask_port
     mcp_port = args.mcp_port
@@ -83,24 +133,27 @@ def main():
     launch_inspector = not args.no_inspector
 
     procs: list[subprocess.Popen] = []
+    stop_probes = threading.Event()
 
     def cleanup(signum=None, frame=None):
         print("\n[run.py] Shutting down...")
+        stop_probes.set()
         for p in procs:
-            try:
-                p.terminate()
-            except OSError:
-                pass
+            _stop_group(p)
         for p in procs:
             try:
                 p.wait(timeout=5)
             except subprocess.TimeoutExpired:
-                p.kill()
+                _stop_group(p, force=True)
         sys.exit(0)
 
     signal.signal(signal.SIGINT, cleanup)
     signal.signal(signal.SIGTERM, cleanup)
 
+    # All services start at once; none needs the others up to boot (MCP and the
+    # UI only call the Flask API per request), so startup costs the slowest
+    # service rather than the sum of all of them.
+
     # ── 1. Flask API ─────────────────────────────────────────────────
     print(f"[run.py] Starting Flask API on port {flask_port}...")
     flask_env = os.environ.copy()
@@ -109,17 +162,10 @@ def main():
         [FLASK_VENV_PYTHON, FLASK_APP, "--host", "0.0.0.0", "--port", str(flask_port)],
         env=flask_env,
         cwd=ROOT,
+        start_new_session=True,
     )
     procs.append(flask_proc)
 
-    print("[run.py] Waiting for Flask API to be ready...")
-    if not wait_for_http(f"http://127.0.0.1:{flask_port}/api/health"):
-        print("[run.py] ERROR: Flask API did not start in time. Aborting.")
-        cleanup()
-        return
-
-    print(f"[run.py] Flask API ready at http://0.0.0.0:{flask_port}")
-
     # ── 2. MCP Server (optional) ─────────────────────────────────────
     mcp_proc = None
     if launch_mcp:
@@ -135,18 +181,9 @@ def main():
             ],
             env=mcp_env,
             cwd=ROOT,
+            start_new_session=True,
         )
         procs.append(mcp_proc)
-        time.sleep(2)
-
-    if flask_proc.poll() is not None:
-        print("[run.py] ERROR: Flask API exited unexpectedly.")
-        cleanup()
-        return
-    if mcp_proc is not None and mcp_proc.poll() is not None:
-        print("[run.py] ERROR: MCP Server exited unexpectedly.")
-        cleanup()
-        return
 
     # ── 3. Streamlit UI ─────────────────────────────────────────────
     ui_proc = None
@@ -164,15 +201,10 @@ def main():
             ],
             env=ui_env,
             cwd=ROOT,
+            start_new_session=True,
         )
         procs.append(ui_proc)
 
-        print("[run.py] Waiting for Streamlit UI to be ready...")
-        if wait_for_http(f"http://127.0.0.1:{ui_port}/_stcore/health", timeout=20):
-            print(f"[run.py] Streamlit UI ready at http://0.0.0.0:{ui_port}")
-        else:
-            print("[run.py] WARNING: Streamlit UI health check timed out (may still be starting).")
-
     # ── 4. MCP Inspector ─────────────────────────────────────────────
     inspector_proc = None
     if launch_inspector:
@@ -190,13 +222,70 @@ def main():
                 [NPX, "-y", "@modelcontextprotocol/inspector"],
                 env=inspector_env,
                 cwd=ROOT,
+                start_new_session=True,
             )
             procs.append(inspector_proc)
 
-            if wait_for_http(f"http://127.0.0.1:{inspector_port}", timeout=30):
-                print(f"[run.py] MCP Inspector ready at http://0.0.0.0:{inspector_port}")
-            else:
-                print("[run.py] WARNING: MCP Inspector health check timed out (may still be starting).")
+    # ── Readiness (probed concurrently) ──────────────────────────────
+    # name -> (process, health url, timeout, ready message, failure message);
+    # Flask is the only hard requirement, and MCP is fatal only if it exits
+    probes = {
+        "Flask API": (
+            flask_proc, f"http://127.0.0.1:{flask_port}/api/health", 15,
+            f"Flask API ready at http://0.0.0.0:{flask_port}",
+            "ERROR: Flask API did not start in time. Aborting.",
+        ),
+    }
+    if mcp_proc is not None:
+        probes["MCP Server"] = (
+            mcp_proc, f"http://127.0.0.1:{mcp_port}/sse", 15,
+            f"MCP Server ready at http://0.0.0.0:{mcp_port}/sse",
+            "WARNING: MCP Server did not respond on /sse in time.",
+        )
+    if ui_proc is not None:
+        probes["Streamlit UI"] = (
+            ui_proc, f"http://127.0.0.1:{ui_port}/_stcore/health", 20,
+            f"Streamlit UI ready at http://0.0.0.0:{ui_port}",
+            "WARNING: Streamlit UI health check timed out (may still be starting).",
+        )
+    if inspector_proc is not None:
+        probes["MCP Inspector"] = (
+            inspector_proc, f"http://127.0.0.1:{inspector_port}", 30,
+            f"MCP Inspector ready at http://0.0.0.0:{inspector_port}",
+            "WARNING: MCP Inspector health check timed out (may still be starting).",
+        )
+
+    print(f"[run.py] Waiting for {', '.join(probes)} to be ready...")
+    flask_ready = False
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = {
+            pool.submit(wait_for_http, url, timeout, stop_probes, proc): name
+            for name, (proc, url, timeout, _, _) in probes.items()
+        }
+        for fut in as_completed(futures):
+            name = futures[fut]
+            _, _, _, ready_msg, fail_msg = probes[name]
+            ready = fut.result()
+            if not ready and stop_probes.is_set():
+                continue  # cancelled by a Flask failure or shutdown, not a real timeout
+            print(f"[run.py] {ready_msg if ready else fail_msg}")
+            if name == "Flask API":
+                flask_ready = ready
+                if not ready:
+                    stop_probes.set()  # don't keep probing services that are about to be stopped
+
+    if not flask_ready:
+        cleanup()
+        return
+
+    if flask_proc.poll() is not None:
+        print("[run.py] ERROR: Flask API exited unexpectedly.")
+        cleanup()
+        return
+    if mcp_proc is not None and mcp_proc.poll() is not None:
+        print("[run.py] ERROR: MCP Server exited unexpectedly.")
+        cleanup()
+        return
 
     # ── Banner ───────────────────────────────────────────────────────
     print()
@@ -215,11 +304,20 @@ def main():
     print()
 
     # ── Monitor ──────────────────────────────────────────────────────
+    # Sleep in waitid() until some child exits; WNOWAIT leaves it unreaped so
+    # Popen.poll() below still sees its status. Without waitid, poll every second.
     while True:
+        if hasattr(os, "waitid"):
+            try:
+                os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT)
+            except ChildProcessError:
+                pass
+        else:
+            time.sleep(1)
         if flask_proc.poll() is not None:
             print("[run.py] Flask API exited. Shutting down.")
             cleanup()
-        if mcp_proc.poll() is not None:
+        if mcp_proc is not None and mcp_proc.poll() is not None:
             print("[run.py] MCP Server exited. Shutting down.")
             cleanup()
         if ui_proc is not None and ui_proc.poll() is not None:
@@ -228,7 +326,6 @@ def main():
         if inspector_proc is not None and inspector_proc.poll() is not None:
             print("[run.py] MCP Inspector exited (non-critical, continuing).")
             inspector_proc = None
-        time.sleep(1)
 
 
 if __name__ == "__main__":
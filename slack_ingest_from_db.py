@@ -18,6 +18,8 @@ Deduping:
 
 Requirements:
   pip install slack_sdk
+  pip install pyahocorasick   (optional; faster keyword matching)
+  pip install orjson          (optional; faster raw_json encoding)
 
 Env vars:
   SLACK_BOT_TOKEN   Bot token (xoxb-...) with scopes: channels:history, groups:history,
@@ -29,6 +31,8 @@ Optional:
                     messages after that time (reduces API calls).
   FULL_REFRESH=1    If set, ignores last_ingested_at and fetches all messages.
   DEBUG=1           Print channel fetches and message counts.
+  SLACK_MAX_WORKERS default 8; channels whose history is fetched concurrently
+                    (rate-limited calls are retried after Slack's Retry-After).
   SCOPE_RULE=1      If set, fall back to scope_rule: link ALL messages to all projects
                     with channel in scope (legacy behavior). Default: use matching only.
   AI_ENABLED=1      If set, use AWS Bedrock to classify messages first; rules (Jira/keyword) used only when AI returns nothing.
@@ -50,10 +54,22 @@ import json
 import re
 import sqlite3
 import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from ai_utils import ai_classify_message_to_projects, ai_format_message_for_status
@@ -71,6 +87,12 @@ FULL_REFRESH = os.environ.get("FULL_REFRESH", "0") == "1"
 DEBUG = os.environ.get("DEBUG", "0") == "1"
 SCOPE_RULE = os.environ.get("SCOPE_RULE", "0") == "1"  # Legacy: link all messages to all projects in scope
 AI_ENABLED = os.environ.get("AI_ENABLED", "0") == "1"
+SLACK_MAX_WORKERS = int(os.environ.get("SLACK_MAX_WORKERS", "8"))
+SLACK_RATE_LIMIT_RETRIES = 5  # 429 retries per call (honours Retry-After) before SlackApiError
+
+WRITE_BATCH_SIZE = 1000  # buffered events per executemany flush
+# Requested page size for cursor-paginated Slack calls; Slack may return fewer per page
+SLACK_PAGE_LIMIT = 1000
 
 # Jira issue key pattern: PROJECT-123
 JIRA_KEY_RE = re.compile(r"\b([A-Z][A-Z0-9]+-\d+)\b")
@@ -102,6 +124,16 @@ def slack_ts_to_iso(ts: str) -> str:
         return now_iso()
 
 
+def dumps_json(obj: Any) -> str:
+    """Serialize to a UTF-8 JSON string, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints beyond 64 bits
+            pass
+    return json.dumps(obj, ensure_ascii=False)
+
+
 def make_permalink(channel_id: str, ts: str) -> str:
     """Build Slack message permalink. ts format: 1700010000.000200"""
     ts_clean = ts.replace(".", "")
@@ -112,6 +144,25 @@ def db_connect(path: str) -> sqlite3.Connection:
     conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
+    # Bulk-ingest tuning: WAL + NORMAL syncs once per checkpoint instead of every commit
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA cache_size = -65536;")  # 64 MB
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    # INSERT OR IGNORE in insert_events needs this for dedupe to be correct, and
+    # load_existing_refs reads it as a covering index (source_ref prefix range).
+    # The bundled schemas create it; this self-heals DBs built from older or
+    # hand-rolled schemas, which would otherwise insert duplicate events.
+    try:
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_events_source_ref ON events(source_type, source_ref)"
+        )
+    except sqlite3.IntegrityError:
+        # Existing duplicates block the index; ingest still dedupes against load_existing_refs
+        print(
+            "Warning: events has duplicate (source_type, source_ref) rows, so idx_events_source_ref "
+            "could not be created. Delete the duplicates (keep one row per source_ref) and rerun."
+        )
     return conn
 
 
@@ -145,6 +196,21 @@ def load_projects_for_ai(conn: sqlite3.Connection) -> List[Dict[str, str]]:
     ]
 
 
+def ai_classify_cached(
+    text: str,
+    projects_for_ai: List[Dict[str, str]],
+    project_ids: List[str],
+    cache: Dict[Tuple[str, Tuple[str, ...]], List[Tuple[str, str, float, str]]],
+) -> List[Tuple[str, str, float, str]]:
+    """ai_classify_message_to_projects, memoized for the run on (prompt text, eligible projects),
+    so repeated bodies (alerts, bot pings) cost one LLM call."""
+    key = (text[:3000], tuple(sorted(project_ids)))  # the prompt only sees the first 3000 chars
+    links = cache.get(key)
+    if links is None:
+        links = cache[key] = ai_classify_message_to_projects(text, projects_for_ai, project_ids)
+    return links
+
+
 def load_project_matching_metadata(conn: sqlite3.Connection) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
     """Load metadata for message-to-project matching.
     Returns:
@@ -163,39 +229,87 @@ def load_project_matching_metadata(conn: sqlite3.Connection) -> Tuple[Dict[str,
             project_key = epic_key.split("-", 1)[0].upper()
             jira_key_to_projects.setdefault(project_key, []).append(project_id)
 
+    # Inverted once (in jira_key_to_projects order) instead of scanning every key per project
+    project_to_jira_keys: Dict[str, List[str]] = {}
+    for pk, pids in jira_key_to_projects.items():
+        for pid in pids:
+            project_to_jira_keys.setdefault(pid, []).append(pk)
+
     # Keywords from project name: extract significant terms (4+ chars, alphanumeric)
     for row in conn.execute("SELECT project_id, name FROM projects").fetchall():
         project_id, name = row[0], (row[1] or "")
-        words = re.findall(r"[A-Za-z0-9]+", name)
-        keywords = [w.lower() for w in words if len(w) >= 4]
-        # Dedupe and add project key if we have it
-        seen = set(keywords)
-        for pk, pids in jira_key_to_projects.items():
-            if project_id in pids and pk.lower() not in seen:
-                keywords.append(pk.lower())
+        # Ordered dedupe, plus the first project key not already a keyword
+        keywords = dict.fromkeys(w.lower() for w in re.findall(r"[A-Za-z0-9]+", name) if len(w) >= 4)
+        for pk in project_to_jira_keys.get(project_id, ()):
+            if pk.lower() not in keywords:
+                keywords[pk.lower()] = None
                 break
-        project_keywords[project_id] = list(dict.fromkeys(keywords)) if keywords else []
+        project_keywords[project_id] = list(keywords)
 
     return jira_key_to_projects, project_keywords
 
 
+def build_jira_key_re(jira_key_to_projects: Dict[str, List[str]]) -> Optional["re.Pattern[str]"]:
+    """Regex matching issue keys of mapped projects only (CLOPS-12, not HTTP-500); group 1
+    is the project key. Finds the same keys as JIRA_KEY_RE plus a dict lookup, without
+    matching every unrelated all-caps token. None if no project keys are mapped."""
+    # Only keys JIRA_KEY_RE could have matched (2+ chars, leading letter)
+    keys = [k for k in jira_key_to_projects if JIRA_KEY_RE.fullmatch(f"{k}-1")]
+    if not keys:
+        return None
+    alternation = "|".join(re.escape(k) for k in sorted(keys, key=len, reverse=True))
+    return re.compile(rf"\b({alternation})-\d+\b")
+
+
+def build_keyword_automaton(project_keywords: Dict[str, List[str]]) -> Any:
+    """Aho-Corasick automaton over every project keyword, so a message is scanned
+    once instead of once per keyword. None if pyahocorasick is not installed."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keywords in project_keywords.values():
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def build_keyword_re(project_keywords: Dict[str, List[str]]) -> Optional["re.Pattern[str]"]:
+    """One alternation over every project keyword, used when pyahocorasick is missing
+    to skip the per-keyword scans for messages that contain no keyword at all.
+    None if there are no keywords."""
+    keywords = {kw for kws in project_keywords.values() for kw in kws}
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+
 def match_message_to_projects(
     text: str,
     eligible_project_ids: List[str],
     jira_key_to_projects: Dict[str, List[str]],
     project_keywords: Dict[str, List[str]],
+    keyword_automaton: Any = None,
+    jira_key_re: Optional["re.Pattern[str]"] = None,
+    keyword_re: Optional["re.Pattern[str]"] = None,
 ) -> List[Tuple[str, str, float, str]]:
     """Match message text to projects. Returns [(project_id, attribution_type, confidence, rationale), ...].
     Only considers projects in eligible_project_ids (those with this channel in scope).
+    keyword_automaton (from build_keyword_automaton) replaces the per-keyword substring scans;
+    without it, keyword_re (from build_keyword_re) skips them for keyword-free messages.
+    jira_key_re (from build_jira_key_re) is built here when not given.
     """
     text_lower = text.lower()
     matches: Dict[str, Tuple[str, float, str]] = {}  # project_id -> (attribution_type, confidence, rationale)
 
     # 1. Jira key matching (entity_match) - highest confidence
-    for m in JIRA_KEY_RE.finditer(text):
-        jira_key = m.group(1)
-        project_key = jira_key.split("-", 1)[0].upper()
-        for project_id in jira_key_to_projects.get(project_key, []):
+    if jira_key_re is None:
+        jira_key_re = build_jira_key_re(jira_key_to_projects)
+    for m in (jira_key_re.finditer(text) if jira_key_re is not None else ()):
+        jira_key = m.group(0)
+        for project_id in jira_key_to_projects[m.group(1)]:
             if project_id in eligible_project_ids:
                 matches[project_id] = (
                     "entity_match",
@@ -204,12 +318,18 @@ def match_message_to_projects(
                 )
 
     # 2. Keyword matching - lower confidence, only if not already matched by entity
+    # Keywords present in the text; per-project checks below become set lookups
+    found: Optional[Set[str]] = None
+    if keyword_automaton is not None:
+        found = {kw for _, kw in keyword_automaton.iter(text_lower)}
+    elif keyword_re is not None and keyword_re.search(text_lower) is None:
+        found = set()
     for project_id in eligible_project_ids:
         if project_id in matches:
             continue
         keywords = project_keywords.get(project_id, [])
         for kw in keywords:
-            if kw in text_lower:
+            if (kw in found) if found is not None else (kw in text_lower):
                 matches[project_id] = (
                     "keyword_match",
                     0.75,
@@ -258,16 +378,20 @@ def set_slack_last_ingested_at(project_id: str, ts: str) -> None:
     _save_slack_checkpoints(data)
 
 
-def event_exists(conn: sqlite3.Connection, source_type: str, source_ref: str) -> bool:
-    row = conn.execute(
-        "SELECT 1 FROM events WHERE source_type=? AND source_ref=? LIMIT 1",
-        (source_type, source_ref),
-    ).fetchone()
-    return row is not None
+def load_existing_refs(conn: sqlite3.Connection, source_type: str, container_id: str) -> Set[str]:
+    """source_refs already stored for one channel, for in-memory dedupe checks.
 
+    Slack source_refs are "<channel_id>:<ts>", so this is a prefix range on the covering
+    idx_events_source_ref index and never touches the (wide, raw_json-carrying) event rows.
+    """
+    rows = conn.execute(
+        "SELECT source_ref FROM events WHERE source_type=? AND source_ref >= ? AND source_ref < ?",
+        (source_type, f"{container_id}:", f"{container_id};"),  # ';' sorts right after ':'
+    )
+    return {r[0] for r in rows}
 
-def insert_event(
-    conn: sqlite3.Connection,
+
+def event_row(
     *,
     event_id: str,
     source_type: str,
@@ -283,36 +407,47 @@ def insert_event(
     text: str,
     permalink: Optional[str],
     raw_obj: Dict[str, Any],
-) -> None:
-    conn.execute(
-        """
-        INSERT INTO events(
-          event_id, source_type, source_ref, occurred_at, ingested_at,
-          container_id, container_name, actor_id, actor_display,
-          event_kind, title, text, permalink, raw_json
-        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-        """,
-        (
-            event_id,
-            source_type,
-            source_ref,
-            occurred_at,
-            ingested_at,
-            container_id,
-            container_name,
-            actor_id,
-            actor_display,
-            event_kind,
-            title,
-            text,
-            permalink,
-            json.dumps(raw_obj, ensure_ascii=False),
-        ),
+) -> Tuple[Any, ...]:
+    """Build an events row in insert_events column order."""
+    return (
+        event_id,
+        source_type,
+        source_ref,
+        occurred_at,
+        ingested_at,
+        container_id,
+        container_name,
+        actor_id,
+        actor_display,
+        event_kind,
+        title,
+        text,
+        permalink,
+        dumps_json(raw_obj),
     )
 
 
-def link_event_to_project(
-    conn: sqlite3.Connection,
+# idx_events_source_ref makes a duplicate (source_type, source_ref) a no-op
+EVENTS_INSERT_SQL = """
+INSERT OR IGNORE INTO events(
+  event_id, source_type, source_ref, occurred_at, ingested_at,
+  container_id, container_name, actor_id, actor_display,
+  event_kind, title, text, permalink, raw_json
+) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+LINKS_INSERT_SQL = """
+INSERT OR IGNORE INTO event_project_links(
+  event_id, project_id, attribution_type, confidence, rationale, created_at
+) VALUES (?,?,?,?,?,?)
+"""
+
+
+def insert_events(cur: sqlite3.Cursor, rows: List[Tuple[Any, ...]]) -> None:
+    cur.executemany(EVENTS_INSERT_SQL, rows)
+
+
+def link_row(
     *,
     event_id: str,
     project_id: str,
@@ -320,75 +455,136 @@ def link_event_to_project(
     confidence: float,
     rationale: str,
     created_at: str,
+) -> Tuple[Any, ...]:
+    """Build an event_project_links row in link_events_to_projects column order."""
+    return (event_id, project_id, attribution_type, confidence, rationale, created_at)
+
+
+def link_events_to_projects(cur: sqlite3.Cursor, rows: List[Tuple[Any, ...]]) -> None:
+    cur.executemany(LINKS_INSERT_SQL, rows)
+
+
+def flush_rows(
+    cur: sqlite3.Cursor,
+    event_rows: List[Tuple[Any, ...]],
+    link_rows: List[Tuple[Any, ...]],
 ) -> None:
-    conn.execute(
-        """
-        INSERT OR IGNORE INTO event_project_links(
-          event_id, project_id, attribution_type, confidence, rationale, created_at
-        ) VALUES (?,?,?,?,?,?)
-        """,
-        (event_id, project_id, attribution_type, confidence, rationale, created_at),
-    )
+    """Write buffered events, then their links (FK order), and clear both buffers."""
+    if event_rows:
+        insert_events(cur, event_rows)
+        event_rows.clear()
+    if link_rows:
+        link_events_to_projects(cur, link_rows)
+        link_rows.clear()
+
+
+_EVENT_ID_TRANS = str.maketrans({":": "_", "/": "_"})
 
 
 def make_event_id(prefix: str, source_ref: str) -> str:
-    safe = source_ref.replace(":", "_").replace("/", "_")
-    return f"{prefix}_{safe}"[:120]
+    return f"{prefix}_{source_ref.translate(_EVENT_ID_TRANS)}"[:120]
 
 
 # -----------------------------
 # Slack API helpers
 # -----------------------------
+# Slack channel IDs: C (public) or G (private) then 8+ uppercase letters/digits.
+# Channel names are always lowercase, so e.g. "customer-support" can't pass for an ID.
+_CHANNEL_ID_RE = re.compile(r"[CG][A-Z0-9]{8,}")
+
+
 def _is_channel_id(scope_value: str) -> bool:
-    """Slack channel IDs start with C (public) or G (private) followed by alphanumeric."""
-    if not scope_value or len(scope_value) < 9:
-        return False
-    return scope_value[0] in ("C", "G") and scope_value[1:].replace("-", "").isalnum()
+    """True if scope_value is a Slack channel ID rather than a channel name."""
+    return bool(scope_value) and _CHANNEL_ID_RE.fullmatch(scope_value) is not None
+
+
+def load_channel_directory(client: WebClient) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """One paginated conversations.list walk -> (lowercase name -> id, id -> name)."""
+    ids_by_name: Dict[str, str] = {}
+    names_by_id: Dict[str, str] = {}
+    cursor = None
+    while True:
+        resp = client.conversations_list(types="public_channel,private_channel", limit=SLACK_PAGE_LIMIT, cursor=cursor)
+        for ch in (resp.get("channels") or []):
+            ch_id = ch.get("id")
+            if not ch_id:
+                continue
+            name = ch.get("name") or ""
+            ids_by_name.setdefault(name.lower(), ch_id)  # first match wins, as in a linear scan
+            names_by_id[ch_id] = name or ch_id
+        cursor = (resp.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            break
+    return ids_by_name, names_by_id
 
 
-def resolve_channel_id(client: WebClient, scope_value: str, cache: Dict[str, str]) -> Optional[str]:
-    """Resolve scope_value to channel ID. If it's already an ID, return as-is. Else look up by name."""
+def resolve_channel_id(
+    client: WebClient,
+    scope_value: str,
+    cache: Dict[str, str],
+    name_cache: Optional[Dict[str, str]] = None,
+) -> Optional[str]:
+    """Resolve scope_value to channel ID. If it's already an ID, return as-is. Else look up by name.
+    The first name lookup lists all channels once into cache (lowercase name -> id) and
+    name_cache (id -> name), so later lookups and get_channel_name need no API call."""
     if _is_channel_id(scope_value):
         return scope_value
-    if scope_value in cache:
-        return cache[scope_value]
+    if not cache:
+        try:
+            ids_by_name, names_by_id = load_channel_directory(client)
+        except SlackApiError:
+            return None
+        cache.update(ids_by_name)
+        if name_cache is not None:
+            name_cache.update(names_by_id)
+    return cache.get(scope_value.lower())
+
+
+def get_channel_name(client: WebClient, channel_id: str, cache: Optional[Dict[str, str]] = None) -> str:
+    """Resolve channel ID to display name, from cache (see resolve_channel_id) when possible."""
+    if cache is not None and channel_id in cache:
+        return cache[channel_id]
     try:
-        cursor = None
-        while True:
-            resp = client.conversations_list(types="public_channel,private_channel", limit=200, cursor=cursor)
-            for ch in (resp.get("channels") or []):
-                if (ch.get("name") or "").lower() == scope_value.lower():
-                    ch_id = ch.get("id")
-                    if ch_id:
-                        cache[scope_value] = ch_id
-                        return ch_id
-            cursor = (resp.get("response_metadata") or {}).get("next_cursor")
-            if not cursor:
-                break
-        return None
+        resp = client.conversations_info(channel=channel_id)
+        ch = (resp.get("channel") or {})
+        name = ch.get("name") or channel_id
     except SlackApiError:
-        return None
+        return channel_id
+    if cache is not None:
+        cache[channel_id] = name
+    return name
+
+
+def _user_display_name(u: Dict[str, Any], user_id: str) -> str:
+    profile = u.get("profile") or {}
+    return profile.get("display_name") or profile.get("real_name") or u.get("name") or user_id
 
 
-def get_channel_name(client: WebClient, channel_id: str) -> str:
-    """Resolve channel ID to display name."""
+def load_user_directory(client: WebClient, cache: Dict[str, str]) -> None:
+    """Fill cache (user ID -> display name) from one paginated users.list walk, so
+    get_user_display rarely needs a per-user users.info call. Best effort: on an
+    API error, users not yet cached fall back to users.info."""
+    cursor = None
     try:
-        resp = client.conversations_info(channel=channel_id)
-        ch = (resp.get("channel") or {})
-        return ch.get("name") or channel_id
+        while True:
+            resp = client.users_list(limit=SLACK_PAGE_LIMIT, cursor=cursor)
+            for u in (resp.get("members") or []):
+                if u.get("id"):
+                    cache[u["id"]] = _user_display_name(u, u["id"])
+            cursor = (resp.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                break
     except SlackApiError:
-        return channel_id
+        pass
 
 
 def get_user_display(client: WebClient, user_id: str, cache: Dict[str, str]) -> str:
-    """Resolve user ID to display name, with caching."""
+    """Resolve user ID to display name, with caching (see load_user_directory)."""
     if user_id in cache:
         return cache[user_id]
     try:
         resp = client.users_info(user=user_id)
-        u = (resp.get("user") or {})
-        profile = u.get("profile") or {}
-        name = profile.get("display_name") or profile.get("real_name") or u.get("name") or user_id
+        name = _user_display_name(resp.get("user") or {}, user_id)
         cache[user_id] = name
         return name
     except SlackApiError:
@@ -400,9 +596,11 @@ def fetch_channel_messages(
     client: WebClient,
     channel_id: str,
     oldest_ts: Optional[str] = None,
-    limit_per_page: int = 200,
+    limit_per_page: int = SLACK_PAGE_LIMIT,
+    latest_ts: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    """Fetch messages from a channel with pagination."""
+    """Fetch messages from a channel with pagination (SLACK_PAGE_LIMIT requested per page).
+    oldest_ts/latest_ts bound the time window (Slack ts strings)."""
     messages: List[Dict[str, Any]] = []
     cursor: Optional[str] = None
 
@@ -413,6 +611,8 @@ def fetch_channel_messages(
         }
         if oldest_ts:
             kwargs["oldest"] = oldest_ts
+        if latest_ts:
+            kwargs["latest"] = latest_ts
         if cursor:
             kwargs["cursor"] = cursor
 
@@ -451,6 +651,41 @@ def message_to_text(msg: Dict[str, Any]) -> str:
 # -----------------------------
 # Ingestion logic
 # -----------------------------
+def channel_oldest_ts(
+    project_ids: List[str], checkpoints: Optional[Dict[str, str]] = None
+) -> Optional[str]:
+    """Slack `oldest` bound for a channel: max Slack checkpoint across its projects
+    (file-based); None unless INCREMENTAL (and not FULL_REFRESH).
+
+    Pass ``checkpoints`` (from _load_slack_checkpoints) to avoid re-reading the file.
+    """
+    if not INCREMENTAL or FULL_REFRESH:
+        return None
+    if checkpoints is None:
+        checkpoints = _load_slack_checkpoints()
+    # now_iso() strings are fixed-width UTC, so the newest sorts last; parse just that one
+    # (falling back to older ones only if a hand-edited entry doesn't parse)
+    for last in sorted(filter(None, (checkpoints.get(pid) for pid in project_ids)), reverse=True):
+        try:
+            return str(datetime.datetime.fromisoformat(last.replace("Z", "+00:00")).timestamp())
+        except Exception:
+            pass
+    return None
+
+
+def fetch_channel(
+    client: WebClient,
+    channel_id: str,
+    oldest_ts: Optional[str],
+    channel_name_cache: Dict[str, str],
+    latest_ts: Optional[str] = None,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Network half of a channel ingest (no DB access): (channel name, messages in (oldest_ts, latest_ts])."""
+    channel_name = get_channel_name(client, channel_id, channel_name_cache)
+    messages = fetch_channel_messages(client, channel_id, oldest_ts=oldest_ts, latest_ts=latest_ts)
+    return channel_name, messages
+
+
 def ingest_channel(
     conn: sqlite3.Connection,
     client: WebClient,
@@ -459,35 +694,48 @@ def ingest_channel(
     project_ids: List[str],
     ingested_at: str,
     user_cache: Dict[str, str],
+    channel_name_cache: Dict[str, str],
     jira_key_to_projects: Dict[str, List[str]],
     project_keywords: Dict[str, List[str]],
     projects_for_ai: List[Dict[str, str]],
+    keyword_automaton: Any = None,
+    jira_key_re: Optional["re.Pattern[str]"] = None,
+    keyword_re: Optional["re.Pattern[str]"] = None,
+    fetched: Optional[Tuple[str, List[Dict[str, Any]]]] = None,
+    ai_cache: Optional[Dict[Tuple[str, Tuple[str, ...]], List[Tuple[str, str, float, str]]]] = None,
 ) -> Dict[str, int]:
     """Ingest messages from a Slack channel into events and event_project_links.
     Links each message only to projects that match (Jira key or keyword).
-    Use SCOPE_RULE=1 for legacy behavior (link all to all)."""
+    Use SCOPE_RULE=1 for legacy behavior (link all to all).
+    Rows are buffered and written in batches of WRITE_BATCH_SIZE events.
+    fetched: fetch_channel() result when already fetched (e.g. on a worker thread).
+    ai_cache: AI classification results shared across channels (see ai_classify_cached)."""
     counters = {"messages": 0, "skipped_existing": 0, "skipped_filter": 0, "no_match": 0}
+    if ai_cache is None:
+        ai_cache = {}
 
-    # oldest_ts = max of Slack checkpoint across all projects for this channel (file-based)
-    oldest_ts: Optional[str] = None
-    if INCREMENTAL and not FULL_REFRESH:
-        for project_id in project_ids:
-            last = get_slack_last_ingested_at(project_id)
-            if last:
-                try:
-                    dt = datetime.datetime.fromisoformat(last.replace("Z", "+00:00"))
-                    ts_val = dt.timestamp()
-                    if oldest_ts is None or ts_val > float(oldest_ts):
-                        oldest_ts = str(ts_val)
-                except Exception:
-                    pass
-
-    channel_name = get_channel_name(client, channel_id)
-    messages = fetch_channel_messages(client, channel_id, oldest_ts=oldest_ts)
+    if fetched is None:
+        fetched = fetch_channel(client, channel_id, channel_oldest_ts(project_ids), channel_name_cache)
+    channel_name, messages = fetched
 
     if DEBUG:
         print(f"    Channel {channel_id} ({channel_name}): {len(messages)} messages fetched")
 
+    # Per-channel constants, hoisted out of the message loop
+    permalink_prefix = f"https://slack.com/archives/{channel_id}/p"  # make_permalink, inlined
+    use_ai_format = AI_ENABLED and _AI_AVAILABLE and ai_format_message_for_status is not None
+    use_ai_classify = AI_ENABLED and _AI_AVAILABLE and ai_classify_message_to_projects is not None
+    scope_links = [
+        (pid, "scope_rule", 1.0, f"Message in channel {channel_name} (slack_channel scope)")
+        for pid in project_ids
+    ]
+
+    event_rows: List[Tuple[Any, ...]] = []
+    link_rows: List[Tuple[Any, ...]] = []
+    # One query instead of a SELECT per message; also covers rows still buffered
+    seen_refs = load_existing_refs(conn, "slack", channel_id)
+    cur = conn.cursor()  # reused by every flush for this channel
+
     for msg in messages:
         if should_skip_message(msg):
             counters["skipped_filter"] += 1
@@ -498,7 +746,7 @@ def ingest_channel(
             continue
 
         source_ref = f"{channel_id}:{ts}"
-        if event_exists(conn, "slack", source_ref):
+        if source_ref in seen_refs:
             counters["skipped_existing"] += 1
             continue
 
@@ -515,16 +763,15 @@ def ingest_channel(
         occurred_at = slack_ts_to_iso(ts)
         raw_text = message_to_text(msg)
         # Optionally format text for clean display in status views (AI_ENABLED)
-        if AI_ENABLED and _AI_AVAILABLE and ai_format_message_for_status:
+        if use_ai_format:
             formatted = ai_format_message_for_status(raw_text)
             text = formatted if formatted else raw_text
         else:
             text = raw_text
-        permalink = make_permalink(channel_id, ts)
+        permalink = permalink_prefix + ts.replace(".", "")
         event_id = make_event_id("slack", source_ref)
 
-        insert_event(
-            conn,
+        event_rows.append(event_row(
             event_id=event_id,
             source_type="slack",
             source_ref=source_ref,
@@ -539,38 +786,45 @@ def ingest_channel(
             text=text,
             permalink=permalink,
             raw_obj=msg,
-        )
+        ))
+        seen_refs.add(source_ref)
 
         # Determine which projects to link: matching or scope_rule (legacy)
         if SCOPE_RULE:
-            links = [(pid, "scope_rule", 1.0, f"Message in channel {channel_name} (slack_channel scope)") for pid in project_ids]
+            links = scope_links
         else:
             # AI first: use LLM to classify when enabled; fall back to rules only when AI returns nothing
             links: List[Tuple[str, str, float, str]] = []
-            if AI_ENABLED and _AI_AVAILABLE and ai_classify_message_to_projects:
-                ai_links = ai_classify_message_to_projects(text, projects_for_ai, project_ids)
+            if use_ai_classify:
+                ai_links = ai_classify_cached(text, projects_for_ai, project_ids, ai_cache)
                 for pid, att, conf, rat in ai_links:
                     if conf >= 0.5:  # Only use AI matches above threshold
                         links.append((pid, att, conf, rat))
             if not links:
-                links = match_message_to_projects(text, project_ids, jira_key_to_projects, project_keywords)
+                links = match_message_to_projects(
+                    text, project_ids, jira_key_to_projects, project_keywords,
+                    keyword_automaton, jira_key_re, keyword_re,
+                )
 
         for project_id, attribution_type, confidence, rationale in links:
-            link_event_to_project(
-                conn,
+            link_rows.append(link_row(
                 event_id=event_id,
                 project_id=project_id,
                 attribution_type=attribution_type,
                 confidence=confidence,
                 rationale=rationale,
                 created_at=ingested_at,
-            )
+            ))
 
         if links:
             counters["messages"] += 1
         else:
             counters["no_match"] += 1
 
+        if len(event_rows) >= WRITE_BATCH_SIZE:
+            flush_rows(cur, event_rows, link_rows)
+
+    flush_rows(cur, event_rows, link_rows)
     return counters
 
 
@@ -589,14 +843,18 @@ def main() -> None:
         return
 
     client = WebClient(token=SLACK_BOT_TOKEN)
+    # Concurrent conversations.history walks hit Tier 3 limits; wait out 429s instead of failing the channel.
+    client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=SLACK_RATE_LIMIT_RETRIES))
     ingested_at = now_iso()
     user_cache: Dict[str, str] = {}
+    ai_cache: Dict[Tuple[str, Tuple[str, ...]], List[Tuple[str, str, float, str]]] = {}
     channel_id_cache: Dict[str, str] = {}
+    channel_name_cache: Dict[str, str] = {}
 
     # Resolve channel names to IDs (scope_value can be name or ID)
     resolved_scopes: List[Tuple[str, str]] = []
     for project_id, scope_value in scopes:
-        ch_id = resolve_channel_id(client, scope_value, channel_id_cache)
+        ch_id = resolve_channel_id(client, scope_value, channel_id_cache, channel_name_cache)
         if ch_id:
             resolved_scopes.append((project_id, ch_id))
         else:
@@ -607,6 +865,9 @@ def main() -> None:
         return
 
     jira_key_to_projects, project_keywords = load_project_matching_metadata(conn)
+    keyword_automaton = build_keyword_automaton(project_keywords)
+    jira_key_re = build_jira_key_re(jira_key_to_projects)
+    keyword_re = build_keyword_re(project_keywords) if keyword_automaton is None else None
     projects_for_ai = load_projects_for_ai(conn)
     if DEBUG:
         print(f"  Jira keys: {dict(jira_key_to_projects)}")
@@ -625,40 +886,74 @@ def main() -> None:
         print("DEBUG=1 -> printing channel fetches")
     print()
 
+    load_user_directory(client, user_cache)
+    if DEBUG:
+        print(f"  Users cached from users.list: {len(user_cache)}")
+
     total = {"messages": 0, "skipped_existing": 0, "skipped_filter": 0, "no_match": 0}
     by_channel = group_scopes_by_channel(resolved_scopes)
 
+    # Checkpoints are read once, before any channel runs, so channels sharing a project all use the
+    # same window; channels scoped to the same project set reuse one computed bound
+    checkpoints = _load_slack_checkpoints()
+    oldest_by_projects: Dict[FrozenSet[str], Optional[str]] = {}
+    oldest_by_channel: Dict[str, Optional[str]] = {}
     for channel_id, project_ids in by_channel.items():
-        print(f"== Ingesting channel {channel_id} for projects {project_ids} ==")
-        try:
-            counters = ingest_channel(
-                conn,
-                client,
-                channel_id=channel_id,
-                project_ids=project_ids,
-                ingested_at=ingested_at,
-                user_cache=user_cache,
-                jira_key_to_projects=jira_key_to_projects,
-                project_keywords=project_keywords,
-                projects_for_ai=projects_for_ai,
-            )
-            conn.commit()
-            for project_id in project_ids:
-                set_slack_last_ingested_at(project_id, ingested_at)
-            conn.commit()
-
-            print(
-                f"  linked to projects: {counters['messages']}\n"
-                f"  no match (stored):  {counters['no_match']}\n"
-                f"  skipped existing:   {counters['skipped_existing']}\n"
-                f"  skipped filter:    {counters['skipped_filter']}"
+        key = frozenset(project_ids)
+        if key not in oldest_by_projects:
+            oldest_by_projects[key] = channel_oldest_ts(project_ids, checkpoints)
+        oldest_by_channel[channel_id] = oldest_by_projects[key]
+    # Incremental runs stop at this run's checkpoint, so the next run's window starts exactly where this one ends
+    latest_ts: Optional[str] = None
+    if INCREMENTAL and not FULL_REFRESH:
+        latest_ts = str(datetime.datetime.fromisoformat(ingested_at.replace("Z", "+00:00")).timestamp())
+
+    # Fetching is network-only, so every channel's history is pulled up front on a thread pool and
+    # overlaps earlier channels' writes. DB writes stay on this thread: SQLite allows one writer at a time.
+    with ThreadPoolExecutor(max_workers=max(1, min(SLACK_MAX_WORKERS, len(by_channel)))) as fetch_pool:
+        fetches = {
+            channel_id: fetch_pool.submit(
+                fetch_channel, client, channel_id, oldest_by_channel[channel_id], channel_name_cache, latest_ts
             )
-            for k in total:
-                total[k] += counters[k]
-        except SlackApiError as e:
-            print(f"  ERROR: {e.response.get('error', 'unknown')} - {e.response.get('error_detail', '')}")
-            if DEBUG:
-                print(f"  Full response: {e.response}")
+            for channel_id in by_channel
+        }
+        for channel_id, project_ids in by_channel.items():
+            print(f"== Ingesting channel {channel_id} for projects {project_ids} ==")
+            try:
+                # One transaction per channel: commits on success, rolls back a partial channel on error
+                with conn:
+                    counters = ingest_channel(
+                        conn,
+                        client,
+                        channel_id=channel_id,
+                        project_ids=project_ids,
+                        ingested_at=ingested_at,
+                        user_cache=user_cache,
+                        channel_name_cache=channel_name_cache,
+                        jira_key_to_projects=jira_key_to_projects,
+                        project_keywords=project_keywords,
+                        projects_for_ai=projects_for_ai,
+                        keyword_automaton=keyword_automaton,
+                        jira_key_re=jira_key_re,
+                        keyword_re=keyword_re,
+                        fetched=fetches[channel_id].result(),
+                        ai_cache=ai_cache,
+                    )
+                for project_id in project_ids:
+                    set_slack_last_ingested_at(project_id, ingested_at)
+
+                print(
+                    f"  linked to projects: {counters['messages']}\n"
+                    f"  no match (stored):  {counters['no_match']}\n"
+                    f"  skipped existing:   {counters['skipped_existing']}\n"
+                    f"  skipped filter:    {counters['skipped_filter']}"
+                )
+                for k in total:
+                    total[k] += counters[k]
+            except SlackApiError as e:
+                print(f"  ERROR: {e.response.get('error', 'unknown')} - {e.response.get('error_detail', '')}")
+                if DEBUG:
+                    print(f"  Full response: {e.response}")
 
     print("== Done ==")
     print(
@@ -668,6 +963,8 @@ def main() -> None:
         f"Total filtered:    {total['skipped_filter']}"
     )
 
+    # Refresh planner stats for tables/indexes this run changed (cheap, unlike ANALYZE)
+    conn.execute("PRAGMA optimize;")
     conn.close()
 
 